@@ -0,0 +1,29 @@
+import argparse
+import os
+
+from benchmark.bench_car_rental_topic import generate_rentals
+from src.car_rental_reconcile import reconcile
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure reconciliation speed-up against the number of workers.")
+    parser.add_argument("--rentals", type=int, default=10**6, help="number of rentals to reconcile (default 10**6)")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count(), help="largest worker count to try")
+    args = parser.parse_args()
+
+    rentals = list(zip(*generate_rentals(args.rentals)))
+    baseline = None
+    print(f"{'workers':>8} {'seconds':>10} {'speed-up':>9} {'busiest worker (s)':>19}")
+    workers = 1
+    while workers <= args.max_workers:
+        report = reconcile(rentals, workers=workers)
+        if baseline is None:
+            baseline = report
+        assert baseline.totals_by_code == report.totals_by_code
+        busiest = max(report.worker_seconds.values())
+        print(f"{workers:>8} {report.seconds:>10.3f} {baseline.seconds / report.seconds:>8.2f}x {busiest:>19.3f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
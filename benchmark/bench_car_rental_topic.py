@@ -0,0 +1,54 @@
+import argparse
+import random
+import time
+
+from src.car_rental_topic import calculate_total_charge, calculate_total_charges
+
+
+def generate_rentals(size: int) -> tuple:
+    """
+    Generate random rental columns (days, ages, codes, odometer starts, odometer finishes) of the given size.
+
+    :param size: Number of rentals to generate
+    :type size: int
+    :return: A tuple of five lists, one per column
+    :rtype: tuple
+    """
+    rng = random.Random(size)
+    num_days = [rng.randint(1, 30) for _ in range(size)]
+    ages = [rng.randint(16, 90) for _ in range(size)]
+    rental_codes = [rng.choice("BD") for _ in range(size)]
+    odometer_starts = [rng.uniform(0, 200000) for _ in range(size)]
+    odometer_finishes = [start + rng.uniform(0, 5000) for start in odometer_starts]
+    return num_days, ages, rental_codes, odometer_starts, odometer_finishes
+
+
+def per_row(columns: tuple) -> list:
+    return [calculate_total_charge(*rental) for rental in zip(*columns)]
+
+
+def batch(columns: tuple) -> list:
+    return calculate_total_charges(*columns)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per row and batch rental billing.")
+    parser.add_argument("--max-exponent", type=int, default=6, help="largest size is 10**max_exponent (default 6)")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'per row (s)':>12} {'batch (s)':>12} {'speed-up':>9}")
+    for exponent in range(3, args.max_exponent + 1):
+        columns = generate_rentals(10**exponent)
+        start = time.perf_counter()
+        expected = per_row(columns)
+        per_row_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        actual = batch(columns)
+        batch_seconds = time.perf_counter() - start
+        assert expected == actual
+        speed_up = per_row_seconds / batch_seconds
+        print(f"{10**exponent:>10} {per_row_seconds:>12.4f} {batch_seconds:>12.4f} {speed_up:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import argparse
+import random
+import time
+
+from src.course import Course
+from src.student import Student
+
+
+def linear_contains(students: list, student: Student) -> bool:
+    """
+    Membership check by scanning every student, as Course did before it kept an index of student numbers.
+
+    :param students: The enrolled students
+    :type students: list
+    :param student: The student to search for
+    :type student: Student
+    :return: True if the student is enrolled, False otherwise
+    :rtype: bool
+    """
+    for s in students:
+        if s == student:
+            return True
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare indexed and linear membership checks on a Course.")
+    parser.add_argument("--max-exponent", type=int, default=5, help="largest course is 10**max_exponent students")
+    parser.add_argument("--queries", type=int, default=1000, help="number of membership checks per size")
+    args = parser.parse_args()
+
+    print(f"{'students':>10} {'linear (s)':>11} {'indexed (s)':>12} {'speed-up':>9}")
+    for exponent in range(2, args.max_exponent + 1):
+        size = 10**exponent
+        students = [Student("First", "Last", number) for number in range(size)]
+        course = Course("CS101")
+        for student in students:
+            course.add(student)
+        rng = random.Random(size)
+        queries = [Student("First", "Last", rng.randrange(2 * size)) for _ in range(args.queries)]
+
+        start = time.perf_counter()
+        expected = [linear_contains(students, query) for query in queries]
+        linear_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        actual = [course.contains(query) for query in queries]
+        indexed_seconds = time.perf_counter() - start
+        assert expected == actual
+        speed_up = linear_seconds / indexed_seconds
+        print(f"{size:>10} {linear_seconds:>11.4f} {indexed_seconds:>12.4f} {speed_up:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
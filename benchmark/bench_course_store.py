@@ -0,0 +1,43 @@
+import argparse
+import os
+import tempfile
+import time
+
+from src.course import Course
+from src.course_store import open_course, save_course
+from src.student import Student
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare opening a saved course with rebuilding it student by student."
+    )
+    parser.add_argument("--students", type=int, default=10**6, help="number of students (default 10**6)")
+    args = parser.parse_args()
+
+    students = [Student(f"First{i}", f"Last{i}", 100000000 + i) for i in range(args.students)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "course.bin")
+        start = time.perf_counter()
+        course = Course("CS101")
+        for student in students:
+            course.add(student)
+        rebuild_seconds = time.perf_counter() - start
+        save_course(course, path)
+
+        start = time.perf_counter()
+        mapped = open_course(path)
+        open_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        student = mapped.get(args.students // 2)
+        get_seconds = time.perf_counter() - start
+        assert student == students[args.students // 2]
+        mapped.close()
+
+    print(f"rebuild with Course.add: {rebuild_seconds * 1000:10.2f} ms")
+    print(f"open_course:             {open_seconds * 1000:10.2f} ms")
+    print(f"first get:               {get_seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import argparse
+import random
+import time
+from array import array
+
+from src.lists_accelerated import contains_fast, index_of_fast, my_sum_fast, np
+from src.lists_topic import contains_while, index_of_for, my_sum
+
+
+def best_time(function, *args, repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the Python loops of lists_topic with their fast paths.")
+    parser.add_argument("--size", type=int, default=10**6, help="number of values searched and summed")
+    args = parser.parse_args()
+
+    values = [random.random() for _ in range(args.size)]
+    haystacks = {"list": values, "array.array": array("d", values)}
+    if np is not None:
+        haystacks["ndarray"] = np.array(values)
+    missing = -1.0
+
+    print(f"NumPy {'is' if np is not None else 'is not'} installed")
+    print(f"{'operation':>10} {'haystack':>12} {'loop (s)':>10} {'fast (s)':>10} {'speed-up':>9}")
+    for name, haystack in haystacks.items():
+        pairs = [
+            ("contains", contains_while, contains_fast, (missing, haystack)),
+            ("index_of", index_of_for, index_of_fast, (missing, haystack)),
+            ("sum", my_sum, my_sum_fast, (haystack,)),
+        ]
+        for operation, loop, fast, fast_args in pairs:
+            loop_seconds = best_time(loop, *fast_args)
+            fast_seconds = best_time(fast, *fast_args)
+            speed_up = loop_seconds / fast_seconds
+            print(f"{operation:>10} {name:>12} {loop_seconds:>10.4f} {fast_seconds:>10.4f} {speed_up:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import argparse
+import math
+import random
+import time
+
+from src.lists_topic import SUM_MODES, my_sum
+
+
+def charges(size: int, rng: random.Random) -> list:
+    # Amounts in dollars and cents, like the totals of car rental invoices
+    return [round(rng.uniform(20, 2000), 2) for _ in range(size)]
+
+
+def mixed_magnitudes(size: int, rng: random.Random) -> list:
+    # Large values that cancel each other out, hiding many small ones
+    values = []
+    for _ in range(size // 2):
+        large = rng.uniform(1e8, 1e9)
+        values += [large, rng.random()] if len(values) % 4 == 0 else [-large, rng.random()]
+    return values
+
+
+DATASETS = {"charges": charges, "mixed magnitudes": mixed_magnitudes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the speed and rounding error of the my_sum modes.")
+    parser.add_argument("--size", type=int, default=10**6, help="number of values summed")
+    args = parser.parse_args()
+
+    print(f"{'dataset':>17} {'mode':>12} {'seconds':>9} {'error vs fsum':>15} {'streamed (s)':>13}")
+    for name, generate in DATASETS.items():
+        values = generate(args.size, random.Random(0))
+        exact = math.fsum(values)
+        for mode in SUM_MODES:
+            start = time.perf_counter()
+            total = my_sum(values, mode)
+            seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            streamed = my_sum((value for value in values), mode)
+            streamed_seconds = time.perf_counter() - start
+            assert streamed == total
+            print(f"{name:>17} {mode:>12} {seconds:>9.4f} {total - exact:>15.3e} {streamed_seconds:>13.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import argparse
+import random
+import time
+
+from src.lists_topic import contains_many, contains_while
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare one linear search per needle with batch searches.")
+    parser.add_argument("--max-exponent", type=int, default=4, help="largest haystack is 10**max_exponent elements")
+    parser.add_argument("--needles", type=int, default=1000, help="number of needles searched per size")
+    args = parser.parse_args()
+
+    print(f"{'haystack':>10} {'per needle (s)':>15} {'hashed (s)':>11} {'merged (s)':>11} {'speed-up':>9}")
+    for exponent in range(2, args.max_exponent + 1):
+        size = 10**exponent
+        rng = random.Random(size)
+        haystack = [rng.randrange(2 * size) for _ in range(size)]
+        needles = [rng.randrange(2 * size) for _ in range(args.needles)]
+
+        start = time.perf_counter()
+        expected = [contains_while(needle, haystack) for needle in needles]
+        linear_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        hashed = contains_many(needles, haystack)
+        hashed_seconds = time.perf_counter() - start
+        sorted_haystack = sorted(haystack)
+        sorted_needles = sorted(needles)
+        start = time.perf_counter()
+        merged = contains_many(sorted_needles, sorted_haystack, both_sorted=True)
+        merged_seconds = time.perf_counter() - start
+        assert expected == hashed
+        assert sorted(zip(needles, expected)) == sorted(zip(sorted_needles, merged))
+        speed_up = linear_seconds / hashed_seconds
+        print(f"{size:>10} {linear_seconds:>15.4f} {hashed_seconds:>11.4f} {merged_seconds:>11.4f} {speed_up:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import argparse
+import os
+import random
+import time
+
+from src.parallel_sort import parallel_sort
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure parallel sort speed-up against the number of workers.")
+    parser.add_argument("--values", type=int, default=10**6, help="number of floats to sort (default 10**6)")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count(), help="largest worker count to try")
+    args = parser.parse_args()
+
+    values = [random.random() for _ in range(args.values)]
+    start = time.perf_counter()
+    expected = sorted(values)
+    sequential_seconds = time.perf_counter() - start
+    print(f"{'workers':>8} {'seconds':>10} {'speed-up':>9}")
+    print(f"{'sorted':>8} {sequential_seconds:>10.3f} {1:>8.2f}x")
+    workers = 2
+    while workers <= args.max_workers:
+        start = time.perf_counter()
+        result = parallel_sort(values, workers=workers)
+        seconds = time.perf_counter() - start
+        assert expected == result
+        print(f"{workers:>8} {seconds:>10.3f} {sequential_seconds / seconds:>8.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import argparse
+import random
+import time
+
+from src.lists_topic import my_sum
+from src.prefix_sum import FenwickTree, PrefixSums
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare summing slices with my_sum against prefix sum structures.")
+    parser.add_argument("--max-exponent", type=int, default=5, help="largest list is 10**max_exponent values")
+    parser.add_argument("--queries", type=int, default=1000, help="number of range sums per size")
+    args = parser.parse_args()
+
+    print(f"{'values':>10} {'my_sum (s)':>11} {'prefix (s)':>11} {'fenwick (s)':>12} {'speed-up':>9}")
+    for exponent in range(2, args.max_exponent + 1):
+        size = 10**exponent
+        rng = random.Random(size)
+        values = [rng.randrange(1000) for _ in range(size)]
+        queries = [sorted([rng.randrange(size + 1), rng.randrange(size + 1)]) for _ in range(args.queries)]
+
+        start = time.perf_counter()
+        expected = [my_sum(values[i:j]) for i, j in queries]
+        slice_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        prefix_sums = PrefixSums(values)
+        prefix = [prefix_sums.range_sum(i, j) for i, j in queries]
+        prefix_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        tree = FenwickTree(values)
+        fenwick = [tree.range_sum(i, j) for i, j in queries]
+        fenwick_seconds = time.perf_counter() - start
+        assert expected == prefix == fenwick
+        speed_up = slice_seconds / prefix_seconds
+        print(f"{size:>10} {slice_seconds:>11.4f} {prefix_seconds:>11.4f} {fenwick_seconds:>12.4f} {speed_up:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import random
+import time
+
+from src.sorting_topic import (
+    adaptive_insertion_sort,
+    binary_insertion_sort,
+    bubble_sort,
+    bubble_sort_improved,
+    hybrid_sort,
+    insertion_sort,
+    merge_sort,
+    selection_sort,
+)
+
+SORTS = [
+    selection_sort,
+    insertion_sort,
+    binary_insertion_sort,
+    adaptive_insertion_sort,
+    bubble_sort,
+    bubble_sort_improved,
+    merge_sort,
+    hybrid_sort,
+]
+
+
+def time_sort(sort, collection: list, repeats: int) -> float:
+    """
+    Time a sort on copies of a collection and return the best time, since some sorts modify their input.
+
+    :param sort: The sorting function
+    :param collection: The collection to sort
+    :type collection: list
+    :param repeats: Number of times to sort
+    :type repeats: int
+    :return: The fastest time in seconds
+    :rtype: float
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        copy = collection[:]
+        start = time.perf_counter()
+        sort(copy)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the sizes where each sort becomes the fastest.")
+    parser.add_argument("--max-size", type=int, default=4096, help="largest collection to sort (default 4096)")
+    parser.add_argument("--repeats", type=int, default=3, help="number of timings per size, the best is kept")
+    args = parser.parse_args()
+
+    print(f"{'size':>7} " + " ".join(f"{sort.__name__:>20}" for sort in SORTS) + "  fastest")
+    size = 2
+    while size <= args.max_size:
+        collection = [random.random() for _ in range(size)]
+        seconds = [time_sort(sort, collection, args.repeats) for sort in SORTS]
+        fastest = SORTS[seconds.index(min(seconds))].__name__
+        print(f"{size:>7} " + " ".join(f"{second:>20.6f}" for second in seconds) + f"  {fastest}")
+        size *= 2
+
+
+if __name__ == "__main__":
+    main()
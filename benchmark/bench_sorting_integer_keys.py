@@ -0,0 +1,36 @@
+import argparse
+import random
+import time
+
+from src.sorting_topic import (
+    auto_sort,
+    counting_sort,
+    hybrid_sort,
+    merge_sort,
+    radix_sort,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare integer sorts with comparison sorts on student numbers.")
+    parser.add_argument("--max-exponent", type=int, default=6, help="largest size is 10**max_exponent (default 6)")
+    args = parser.parse_args()
+
+    sorts = [merge_sort, hybrid_sort, radix_sort, counting_sort, auto_sort]
+    print(f"{'size':>9} " + " ".join(f"{sort.__name__:>14}" for sort in sorts))
+    for exponent in range(3, args.max_exponent + 1):
+        size = 10**exponent
+        # Nine digit student numbers, densely packed enough for counting sort to be reasonable
+        student_numbers = random.sample(range(100000000, 100000000 + 2 * size), size)
+        expected = sorted(student_numbers)
+        seconds = []
+        for sort in sorts:
+            start = time.perf_counter()
+            result = sort(student_numbers)
+            seconds.append(time.perf_counter() - start)
+            assert expected == result
+        print(f"{size:>9} " + " ".join(f"{second:>14.4f}" for second in seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import argparse
+import random
+import tracemalloc
+
+from src.sorting_topic import (
+    bubble_sort,
+    bubble_sort_improved,
+    bubble_sort_improved_in_place,
+    bubble_sort_in_place,
+    insertion_sort,
+    insertion_sort_in_place,
+    selection_sort,
+    selection_sort_in_place,
+)
+
+PAIRS = [
+    (selection_sort, selection_sort_in_place),
+    (insertion_sort, insertion_sort_in_place),
+    (bubble_sort, bubble_sort_in_place),
+    (bubble_sort_improved, bubble_sort_improved_in_place),
+]
+
+
+def peak_bytes(sort, collection: list) -> int:
+    """
+    Measure the peak memory allocated while sorting a copy of a collection.
+
+    :param sort: The sorting function
+    :param collection: The collection to sort
+    :type collection: list
+    :return: Peak bytes allocated during the sort
+    :rtype: int
+    """
+    copy = collection[:]
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    sort(copy)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the peak memory of copying and in place sorts.")
+    parser.add_argument("--size", type=int, default=2000, help="number of elements to sort (default 2000)")
+    args = parser.parse_args()
+
+    collection = [random.random() for _ in range(args.size)]
+    print(f"{'algorithm':<22} {'copying (bytes)':>16} {'in place (bytes)':>17}")
+    for copying, in_place in PAIRS:
+        print(f"{copying.__name__:<22} {peak_bytes(copying, collection):>16} {peak_bytes(in_place, collection):>17}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+import argparse
+import json
+import platform
+import random
+import sys
+
+from benchmark.bench_sorting_crossover import time_sort
+from benchmark.bench_sorting_memory import peak_bytes
+from src.sorting_topic import (
+    adaptive_insertion_sort,
+    auto_sort,
+    binary_insertion_sort,
+    bubble_sort,
+    bubble_sort_improved,
+    bubble_sort_improved_in_place,
+    bubble_sort_in_place,
+    counting_sort,
+    hybrid_sort,
+    insertion_sort,
+    insertion_sort_in_place,
+    merge_sort,
+    radix_sort,
+    selection_sort,
+    selection_sort_in_place,
+)
+
+# Sorts taking quadratic time are only run up to --quadratic-max-size elements
+QUADRATIC_SORTS = [
+    selection_sort,
+    selection_sort_in_place,
+    insertion_sort,
+    insertion_sort_in_place,
+    binary_insertion_sort,
+    adaptive_insertion_sort,
+    bubble_sort,
+    bubble_sort_in_place,
+    bubble_sort_improved,
+    bubble_sort_improved_in_place,
+]
+FAST_SORTS = [merge_sort, hybrid_sort, counting_sort, radix_sort, auto_sort, sorted]
+
+
+def random_values(size: int, rng: random.Random) -> list:
+    return [rng.randrange(size * 10) for _ in range(size)]
+
+
+def sorted_values(size: int, rng: random.Random) -> list:
+    return sorted(random_values(size, rng))
+
+
+def reversed_values(size: int, rng: random.Random) -> list:
+    return sorted(random_values(size, rng), reverse=True)
+
+
+def nearly_sorted_values(size: int, rng: random.Random) -> list:
+    # Sorted, then about 1% of the elements swapped with a random other element
+    values = sorted_values(size, rng)
+    for _ in range(max(size // 100, 1)):
+        i, j = rng.randrange(size), rng.randrange(size)
+        values[i], values[j] = values[j], values[i]
+    return values
+
+
+def many_duplicates_values(size: int, rng: random.Random) -> list:
+    return [rng.randrange(10) for _ in range(size)]
+
+
+DISTRIBUTIONS = {
+    "random": random_values,
+    "sorted": sorted_values,
+    "reversed": reversed_values,
+    "nearly_sorted": nearly_sorted_values,
+    "many_duplicates": many_duplicates_values,
+}
+
+
+def sizes_up_to(max_size: int) -> list:
+    sizes = []
+    size = 10
+    while size <= max_size:
+        sizes.append(size)
+        size *= 10
+    return sizes
+
+
+def run(max_size: int, quadratic_max_size: int, repeats: int, seed: int) -> list:
+    """
+    Run every sort on every distribution at sizes 10, 100, ... up to max_size.
+
+    :return: One result per sort, distribution and size, with the best time in seconds and the peak memory in bytes
+    :rtype: list
+    """
+    results = []
+    for size in sizes_up_to(max_size):
+        for distribution, generate in DISTRIBUTIONS.items():
+            collection = generate(size, random.Random(seed))
+            sorts = FAST_SORTS + (QUADRATIC_SORTS if size <= quadratic_max_size else [])
+            for sort in sorts:
+                result = {
+                    "sort": sort.__name__,
+                    "distribution": distribution,
+                    "size": size,
+                    "seconds": time_sort(sort, collection, repeats),
+                    "peak_bytes": peak_bytes(sort, collection),
+                }
+                print(
+                    f"{result['sort']:>30} {distribution:>16} {size:>8} "
+                    f"{result['seconds']:>12.6f} {result['peak_bytes']:>12}"
+                )
+                results.append(result)
+    return results
+
+
+def regressions(results: list, baseline: list, tolerance: float) -> list:
+    """
+    Compare results with those of an earlier run and return the ones that got slower by more than the tolerance.
+
+    :param results: The results of this run
+    :param baseline: The results of an earlier run
+    :param tolerance: Allowed slow down as a fraction, 0.2 allows 20% slower
+    :return: (result, baseline seconds) for every result slower than its baseline by more than the tolerance
+    :rtype: list
+    """
+    baseline_seconds = {(r["sort"], r["distribution"], r["size"]): r["seconds"] for r in baseline}
+    slower = []
+    for result in results:
+        seconds = baseline_seconds.get((result["sort"], result["distribution"], result["size"]))
+        if seconds is not None and result["seconds"] > seconds * (1 + tolerance):
+            slower.append((result, seconds))
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every sort across sizes and input distributions.")
+    parser.add_argument("--max-size", type=int, default=10**6, help="largest collection to sort (default 10^6)")
+    parser.add_argument(
+        "--quadratic-max-size", type=int, default=1000, help="largest collection for the quadratic sorts (default 1000)"
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="number of timings per case, the best is kept")
+    parser.add_argument("--seed", type=int, default=0, help="seed for generating the collections")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="JSON file of an earlier run to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slow down against the baseline")
+    args = parser.parse_args()
+
+    print(f"{'sort':>30} {'distribution':>16} {'size':>8} {'seconds':>12} {'peak_bytes':>12}")
+    results = run(args.max_size, args.quadratic_max_size, args.repeats, args.seed)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"python": platform.python_version(), "seed": args.seed, "results": results}, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        slower = regressions(results, baseline, args.tolerance)
+        for result, seconds in slower:
+            print(
+                f"regression: {result['sort']} on {result['size']} {result['distribution']} values took "
+                f"{result['seconds']:.6f}s against {seconds:.6f}s"
+            )
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
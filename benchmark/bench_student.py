@@ -0,0 +1,64 @@
+import argparse
+import tracemalloc
+
+from src.student import Student
+from src.student_table import StudentTable
+
+
+class DictStudent:
+    """
+    A Student laid out as it was before Student declared __slots__, with a per instance __dict__.
+    """
+
+    def __init__(self, first_name: str, last_name: str, student_number: int):
+        self.first_name = first_name
+        self.last_name = last_name
+        self.student_number = student_number
+
+
+def build_objects(student_class, size: int) -> list:
+    return [student_class(f"First{i}", f"Last{i}", 100000000 + i) for i in range(size)]
+
+
+def build_table(size: int) -> StudentTable:
+    table = StudentTable()
+    for i in range(size):
+        table.add(Student(f"First{i}", f"Last{i}", 100000000 + i))
+    return table
+
+
+def bytes_per_student(build, size: int) -> float:
+    """
+    Measure the memory held by the result of build(size), per student.
+
+    :param build: A function creating a collection of size students
+    :param size: Number of students to create
+    :type size: int
+    :return: Bytes allocated and still held after building, divided by the number of students
+    :rtype: float
+    """
+    tracemalloc.start()
+    students = build(size)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del students
+    return held / size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the memory used per student by each layout.")
+    parser.add_argument("--students", type=int, default=10**5, help="number of students to create (default 10**5)")
+    args = parser.parse_args()
+
+    layouts = [
+        ("dict based objects", lambda size: build_objects(DictStudent, size)),
+        ("slots based objects", lambda size: build_objects(Student, size)),
+        ("columnar table", build_table),
+    ]
+    print(f"{'layout':<20} {'bytes per student':>18}")
+    for name, build in layouts:
+        print(f"{name:<20} {bytes_per_student(build, args.students):>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
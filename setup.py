@@ -10,7 +10,7 @@ def run_code_formatters():
 
 
 def run_code_verification():
-    tool = "flake8 src/ test/"
+    tool = "flake8 src/ test/ benchmark/"
     print(f"running `{tool}`")
     subprocess.run(tool, shell=True)
 
@@ -0,0 +1,178 @@
+import csv
+import time
+from itertools import islice
+
+from src.car_rental_topic import calculate_total_charges
+
+LEDGER_HEADER = ["num_days", "age", "rental_code", "odometer_start", "odometer_finish"]
+
+
+class LedgerStats:
+    """
+    Throughput counters for a ledger being billed. The counters are updated as the ledger streams through the
+    pipeline, so they can be read while billing is still in progress.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.bytes_read = 0
+        self._start = time.perf_counter()
+        self._end = None
+
+    def finish(self):
+        self._end = time.perf_counter()
+
+    def seconds(self) -> float:
+        """
+        Calculate the time spent billing so far, or the total time if billing has finished.
+
+        :return: Number of seconds since the counters were created
+        :rtype: float
+        """
+        end = self._end if self._end is not None else time.perf_counter()
+        return end - self._start
+
+    def rows_per_second(self) -> float:
+        """
+        Calculate the billing throughput in rows per second.
+
+        :return: Rows billed per second, or 0 if no time has passed
+        :rtype: float
+        """
+        seconds = self.seconds()
+        if seconds == 0:
+            return 0.0
+        return self.rows / seconds
+
+    def __repr__(self) -> str:
+        return f"LedgerStats(rows={self.rows}, bytes_read={self.bytes_read}, rows_per_second={self.rows_per_second()})"
+
+
+def _decoded_lines(source, stats: LedgerStats, encoding: str):
+    """
+    Yield the lines of a binary file as strings while counting the number of bytes read.
+
+    :param source: A file opened in binary mode
+    :param stats: Counters to update
+    :type stats: LedgerStats
+    :param encoding: Encoding of the file
+    :type encoding: str
+    """
+    for line in source:
+        stats.bytes_read += len(line)
+        yield line.decode(encoding)
+
+
+def _rental_rows(reader):
+    """
+    Yield the rows of a ledger CSV reader, skipping blank lines. Each number is checked here, where the line number is
+    known, but the row is yielded unchanged so the invoices repeat the ledger's own text.
+
+    :param reader: A csv.reader positioned after the header
+    :raise ValueError: If a row does not have one field per column of LEDGER_HEADER, or a field other than the rental
+        code is not a number
+    """
+    for row in reader:
+        if not row:
+            continue
+        if len(row) != len(LEDGER_HEADER):
+            raise ValueError(
+                f"Ledger line {reader.line_num} has {len(row)} fields, expected {len(LEDGER_HEADER)}: {row}"
+            )
+        for column, value in zip(LEDGER_HEADER, row):
+            if column == "rental_code":
+                continue
+            try:
+                float(value)
+            except ValueError:
+                raise ValueError(f"Ledger line {reader.line_num} has {column} {value!r}, expected a number: {row}")
+        yield row
+
+
+def read_rental_chunks(source, chunk_size: int, stats: LedgerStats, encoding: str = "utf-8"):
+    """
+    Read a rental ledger CSV in chunks of at most chunk_size rows. The first line of the file must be the header
+    described by LEDGER_HEADER. Blank lines, such as a trailing empty line, are skipped. Only one chunk is held in
+    memory at a time.
+
+    :param source: The ledger, opened in binary mode
+    :param chunk_size: Maximum number of rows per chunk
+    :type chunk_size: int
+    :param stats: Counters to update as bytes are read
+    :type stats: LedgerStats
+    :param encoding: Encoding of the ledger
+    :type encoding: str
+    :raise ValueError: If the chunk size is not positive, the header is not LEDGER_HEADER, a row does not have one
+        field per column or a field other than the rental code is not a number
+    :return: A generator of lists of rows, each row being a list of strings
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    reader = csv.reader(_decoded_lines(source, stats, encoding))
+    header = next(reader, None)
+    if header != LEDGER_HEADER:
+        raise ValueError(f"Expected ledger header {LEDGER_HEADER}, got {header}")
+    rows = _rental_rows(reader)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def bill_chunks(chunks, stats: LedgerStats):
+    """
+    Bill each chunk of rental rows with calculate_total_charges.
+
+    :param chunks: An iterable of lists of rows as produced by read_rental_chunks
+    :param stats: Counters to update as rows are billed
+    :type stats: LedgerStats
+    :return: A generator of (rows, charges) pairs, one per chunk
+    """
+    for chunk in chunks:
+        num_days, ages, rental_codes, odometer_starts, odometer_finishes = zip(*chunk)
+        charges = calculate_total_charges(
+            [float(value) for value in num_days],
+            [float(value) for value in ages],
+            rental_codes,
+            [float(value) for value in odometer_starts],
+            [float(value) for value in odometer_finishes],
+        )
+        stats.rows += len(chunk)
+        yield chunk, charges
+
+
+def write_invoices(billed_chunks, invoices):
+    """
+    Write each billed rental to the invoices CSV as soon as its chunk has been billed. Each invoice row is the rental
+    row followed by its total charge.
+
+    :param billed_chunks: An iterable of (rows, charges) pairs as produced by bill_chunks
+    :param invoices: A file opened in text mode (with newline="") to write the invoices to
+    """
+    writer = csv.writer(invoices)
+    writer.writerow(LEDGER_HEADER + ["total_charge"])
+    for rows, charges in billed_chunks:
+        writer.writerows(row + [charge] for row, charge in zip(rows, charges))
+
+
+def bill_ledger(source, invoices, chunk_size: int = 10000, stats: LedgerStats = None) -> LedgerStats:
+    """
+    Stream a rental ledger through the billing pipeline, reading, billing and writing one chunk at a time so the
+    memory used does not depend on the size of the ledger.
+
+    :param source: The ledger, opened in binary mode
+    :param invoices: A file opened in text mode (with newline="") to write the invoices to
+    :param chunk_size: Maximum number of rows held in memory at once
+    :type chunk_size: int
+    :param stats: Counters to update, useful for watching progress from another thread. New counters are created if
+        none are given.
+    :type stats: LedgerStats
+    :return: The throughput counters for the billing run
+    :rtype: LedgerStats
+    """
+    if stats is None:
+        stats = LedgerStats()
+    write_invoices(bill_chunks(read_rental_chunks(source, chunk_size, stats), stats), invoices)
+    stats.finish()
+    return stats
@@ -0,0 +1,157 @@
+import json
+from bisect import bisect_right
+
+# The rates hard coded in calculate_total_charge. Codes not listed in "codes" use the "default" rate. A
+# daily_km_allowance of None charges every km driven, otherwise only the average daily kms above the allowance are
+# charged. The first age bracket also covers every age below the second bracket's min_age.
+DEFAULT_RATE_TABLE = {
+    "codes": {
+        "B": {"daily_rate": 20.00, "km_rate": 0.30, "daily_km_allowance": None},
+    },
+    "default": {"daily_rate": 50.00, "km_rate": 0.30, "daily_km_allowance": 100},
+    "age_brackets": [
+        {"min_age": 0, "daily_surcharge": 10},
+        {"min_age": 25, "daily_surcharge": 0},
+    ],
+}
+
+
+class CompiledRates:
+    """
+    A rate table compiled into lookup structures. Rental codes map directly to a (daily rate, km rate, allowance)
+    tuple and an age is mapped to its surcharge by bisecting the bracket boundaries, so pricing a rental needs no
+    chain of branches over codes or ages. Compiled rates are never modified after they are created.
+    """
+
+    def __init__(self, code_rates: dict, default_rate: tuple, bracket_bounds: list, surcharges: list):
+        self.code_rates = code_rates
+        self.default_rate = default_rate
+        self.bracket_bounds = bracket_bounds
+        self.surcharges = surcharges
+
+    def price(self, num_days: float, age: float, rental_code: str, odometer_start: float, odometer_finish: float):
+        """
+        Calculate how much the renter needs to be charged under these rates.
+
+        :param num_days: Number of days the car was rented.
+        :param age: Age of the driver.
+        :param rental_code: The classification code.
+        :param odometer_start: Odometer when the renter took the car.
+        :param odometer_finish: Odometer when the renter returned the car.
+        :return: The amount to charge the renter.
+        :rtype: float
+        """
+        daily_rate, km_rate, allowance = self.code_rates.get(rental_code, self.default_rate)
+        kms = odometer_finish - odometer_start
+        average_kms = kms / num_days
+        if allowance is None:
+            charge = daily_rate * num_days + km_rate * kms
+        else:
+            charge = daily_rate * num_days + km_rate * max(average_kms - allowance, 0)
+        return charge + self.surcharges[bisect_right(self.bracket_bounds, age)] * num_days
+
+
+def _compile_rate(rate: dict) -> tuple:
+    try:
+        return rate["daily_rate"], rate["km_rate"], rate["daily_km_allowance"]
+    except KeyError as e:
+        raise ValueError(f"Rate {rate} is missing {e}")
+
+
+def compile_rate_table(table: dict) -> CompiledRates:
+    """
+    Validate a rate table and compile it into a CompiledRates lookup structure. See DEFAULT_RATE_TABLE for the layout
+    of a rate table.
+
+    :param table: The rate table to compile
+    :type table: dict
+    :raise ValueError: If the table is missing entries or the age brackets are not in increasing order of min_age
+    :return: The compiled rates
+    :rtype: CompiledRates
+    """
+    try:
+        code_rates = {code: _compile_rate(rate) for code, rate in table["codes"].items()}
+        default_rate = _compile_rate(table["default"])
+        brackets = table["age_brackets"]
+        min_ages = [bracket["min_age"] for bracket in brackets]
+        surcharges = [bracket["daily_surcharge"] for bracket in brackets]
+    except KeyError as e:
+        raise ValueError(f"Rate table is missing {e}")
+    if not brackets:
+        raise ValueError("Rate table needs at least one age bracket")
+    if min_ages != sorted(set(min_ages)):
+        raise ValueError("Age brackets must be in increasing order of min_age")
+    return CompiledRates(code_rates, default_rate, min_ages[1:], surcharges)
+
+
+def load_rate_table(path: str) -> dict:
+    """
+    Load a rate table from a JSON file. See DEFAULT_RATE_TABLE for the layout of a rate table.
+
+    :param path: Path to the JSON file
+    :type path: str
+    :return: The rate table
+    :rtype: dict
+    """
+    with open(path) as file:
+        return json.load(file)
+
+
+class RatePricer:
+    """
+    Prices rentals from a rate table that can be reloaded while other threads are pricing. A reload compiles the new
+    table completely before swapping it in with a single assignment, so a price is always calculated entirely from
+    either the old or the new table, never a mix of both.
+    """
+
+    def __init__(self, table: dict = None):
+        self._rates = compile_rate_table(DEFAULT_RATE_TABLE if table is None else table)
+
+    def reload(self, table: dict):
+        """
+        Replace the rate table. If the new table is invalid the current rates are kept.
+
+        :param table: The new rate table
+        :type table: dict
+        :raise ValueError: If the new table is invalid
+        """
+        self._rates = compile_rate_table(table)
+
+    def rates(self) -> CompiledRates:
+        return self._rates
+
+    def price(self, num_days: float, age: float, rental_code: str, odometer_start: float, odometer_finish: float):
+        """
+        Calculate how much the renter needs to be charged under the current rate table.
+
+        :param num_days: Number of days the car was rented.
+        :param age: Age of the driver.
+        :param rental_code: The classification code.
+        :param odometer_start: Odometer when the renter took the car.
+        :param odometer_finish: Odometer when the renter returned the car.
+        :return: The amount to charge the renter.
+        :rtype: float
+        """
+        return self._rates.price(num_days, age, rental_code, odometer_start, odometer_finish)
+
+    def price_many(
+        self, num_days: list, ages: list, rental_codes: list, odometer_starts: list, odometer_finishes: list
+    ) -> list:
+        """
+        Calculate the charges for a batch of rentals given as columns, all priced from the same rate table even if
+        the table is reloaded part way through.
+
+        :param num_days: Number of days each car was rented.
+        :param ages: Age of each driver.
+        :param rental_codes: The classification code of each rental.
+        :param odometer_starts: Odometer of each car when the renter took the car.
+        :param odometer_finishes: Odometer of each car when the renter returned the car.
+        :raise ValueError: If the columns are not all the same length.
+        :return: The amount to charge each renter, in the same order as the columns.
+        :rtype: list
+        """
+        price = self._rates.price
+        return [
+            price(*rental)
+            for rental in zip(num_days, ages, rental_codes, odometer_starts, odometer_finishes, strict=True)
+        ]
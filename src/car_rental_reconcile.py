@@ -0,0 +1,134 @@
+import os
+import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+from src.car_rental_rates import DEFAULT_RATE_TABLE
+from src.car_rental_topic import calculate_total_charges
+
+DEFAULT_BRACKET_MIN_AGES = [bracket["min_age"] for bracket in DEFAULT_RATE_TABLE["age_brackets"]]
+
+
+class ReconciliationReport:
+    """
+    The result of a reconciliation run. Totals are keyed by rental code and by the min_age of each age bracket and are
+    listed in sorted key order. Worker timings are keyed by the process id of each worker.
+    """
+
+    def __init__(self, rentals: int, totals_by_code: dict, totals_by_age_bracket: dict, worker_seconds: dict):
+        self.rentals = rentals
+        self.totals_by_code = totals_by_code
+        self.totals_by_age_bracket = totals_by_age_bracket
+        self.worker_seconds = worker_seconds
+        self.seconds = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"ReconciliationReport(rentals={self.rentals}, totals_by_code={self.totals_by_code}, "
+            f"totals_by_age_bracket={self.totals_by_age_bracket}, seconds={self.seconds})"
+        )
+
+
+def _bill_shard(rentals: list, bracket_min_ages: list) -> tuple:
+    """
+    Bill one shard of rentals and total the charges per rental code and per age bracket. Charges are added in the
+    order of the rentals so the totals of a shard do not depend on which worker billed it.
+
+    :param rentals: The rentals of the shard as (num_days, age, rental_code, odometer_start, odometer_finish) tuples
+    :type rentals: list
+    :param bracket_min_ages: The min_age of every age bracket, in increasing order
+    :type bracket_min_ages: list
+    :return: The totals per code, the totals per bracket, the worker's process id and the seconds spent billing
+    :rtype: tuple
+    """
+    start = time.perf_counter()
+    totals_by_code = {}
+    totals_by_age_bracket = {}
+    bounds = bracket_min_ages[1:]
+    if rentals:
+        charges = calculate_total_charges(*zip(*rentals))
+        for rental, charge in zip(rentals, charges):
+            code = rental[2]
+            bracket = bracket_min_ages[bisect_right(bounds, rental[1])]
+            totals_by_code[code] = totals_by_code.get(code, 0) + charge
+            totals_by_age_bracket[bracket] = totals_by_age_bracket.get(bracket, 0) + charge
+    return totals_by_code, totals_by_age_bracket, os.getpid(), time.perf_counter() - start
+
+
+# The rentals being reconciled, set in each worker process when the pool starts so that tasks only need to send the
+# bounds of their shard rather than pickling the rentals themselves
+_worker_rentals = []
+
+
+def _init_worker(rentals: list):
+    global _worker_rentals
+    _worker_rentals = rentals
+
+
+def _bill_worker_shard(start: int, stop: int, bracket_min_ages: list) -> tuple:
+    return _bill_shard(_worker_rentals[start:stop], bracket_min_ages)
+
+
+def _merge(totals: dict, shard_totals: dict):
+    for key, value in shard_totals.items():
+        totals[key] = totals.get(key, 0) + value
+
+
+def reconcile(
+    rentals: list, workers: int = None, shard_size: int = 10000, bracket_min_ages: list = None
+) -> ReconciliationReport:
+    """
+    Re-price every rental across a pool of worker processes and total the charges per rental code and per age
+    bracket.
+
+    The rentals are cut into shards of shard_size rentals regardless of the number of workers, and shard totals are
+    merged in shard order. The totals are therefore identical, down to floating point rounding, for any number of
+    workers.
+
+    :param rentals: The rentals as (num_days, age, rental_code, odometer_start, odometer_finish) tuples
+    :type rentals: list
+    :param workers: Number of worker processes, defaults to the number of CPUs. With 1 worker the rentals are billed
+        in the calling process.
+    :type workers: int
+    :param shard_size: Number of rentals billed per task
+    :type shard_size: int
+    :param bracket_min_ages: The min_age of every age bracket, in increasing order. Defaults to the brackets of
+        DEFAULT_RATE_TABLE.
+    :type bracket_min_ages: list
+    :raise ValueError: If workers or shard_size is not positive
+    :return: The totals and the time each worker spent billing
+    :rtype: ReconciliationReport
+    """
+    if workers is None:
+        workers = os.cpu_count()
+    if workers < 1 or shard_size < 1:
+        raise ValueError("workers and shard_size must be at least 1")
+    if bracket_min_ages is None:
+        bracket_min_ages = DEFAULT_BRACKET_MIN_AGES
+
+    start = time.perf_counter()
+    starts = range(0, len(rentals), shard_size)
+    stops = [min(shard_start + shard_size, len(rentals)) for shard_start in starts]
+    brackets = [bracket_min_ages] * len(starts)
+    if workers == 1:
+        results = [_bill_shard(rentals[shard_start:stop], bracket_min_ages) for shard_start, stop in zip(starts, stops)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(rentals,)) as executor:
+            results = list(executor.map(_bill_worker_shard, starts, stops, brackets))
+
+    totals_by_code = {}
+    totals_by_age_bracket = {}
+    worker_seconds = {}
+    for shard_by_code, shard_by_age_bracket, pid, seconds in results:
+        _merge(totals_by_code, shard_by_code)
+        _merge(totals_by_age_bracket, shard_by_age_bracket)
+        worker_seconds[pid] = worker_seconds.get(pid, 0) + seconds
+
+    report = ReconciliationReport(
+        len(rentals),
+        dict(sorted(totals_by_code.items())),
+        dict(sorted(totals_by_age_bracket.items())),
+        dict(sorted(worker_seconds.items())),
+    )
+    report.seconds = time.perf_counter() - start
+    return report
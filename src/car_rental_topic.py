@@ -111,3 +111,43 @@ assert 190 == calculate_total_charge(2, 30, "B", 0, 500)
 assert 145 == calculate_total_charge(2, 30, "D", 0, 500)
 assert 210 == calculate_total_charge(2, 20, "B", 0, 500)
 assert 165 == calculate_total_charge(2, 20, "D", 0, 500)
+
+
+def calculate_total_charges(
+    num_days: list, ages: list, rental_codes: list, odometer_starts: list, odometer_finishes: list
+) -> list:
+    """
+    Calculate the charges for a batch of rentals. Each parameter is a column of values where the rental at index i is
+    described by the i'th value of every column. The result is the same as calling calculate_total_charge on every
+    rental, but the work is done in a single pass over the columns without the per rental function calls.
+
+    :rtype: list
+    :param num_days: Number of days each car was rented.
+    :param ages: Age of each driver.
+    :param rental_codes: The classification code (B or D) of each rental.
+    :param odometer_starts: Odometer of each car when the renter took the car.
+    :param odometer_finishes: Odometer of each car when the renter returned the car.
+    :raise ValueError: If the columns are not all the same length.
+    :return: The amount to charge each renter, in the same order as the columns.
+    """
+    charges = []
+    for days, age, code, start, finish in zip(
+        num_days, ages, rental_codes, odometer_starts, odometer_finishes, strict=True
+    ):
+        kms = finish - start
+        average_kms = kms / days
+        if code == "B":
+            charge = 20.00 * days + 0.30 * kms
+        elif average_kms > 100:
+            charge = 50.00 * days + 0.30 * (average_kms - 100)
+        else:
+            charge = 50.00 * days
+        if age < 25:
+            charge += 10 * days
+        charges.append(charge)
+    return charges
+
+
+assert [] == calculate_total_charges([], [], [], [], [])
+assert [20, 50] == calculate_total_charges([1, 1], [30, 30], ["B", "D"], [0, 0], [0, 0])
+assert [210, 165] == calculate_total_charges([2, 2], [20, 20], ["B", "D"], [0, 0], [500, 500])
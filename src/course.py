@@ -5,17 +5,46 @@ class Course:
     """
     A collection of students enrolled in a course. This class manages the individual Students and provides simple
     enrollment details.
+
+    Students are kept in insertion order in a dictionary keyed by an increasing enrollment ticket. An index from each
+    student number to the tickets of the students with that number, oldest first, makes checking for and removing a
+    student take constant time rather than a scan over every enrolled student.
+
+    The index is built from the student number each student has when added, so an enrolled student's number must not
+    change. To change it, remove the student, change the number and add the student again.
     """
 
     def __init__(self, course_name: str):
         self.course_name = course_name
-        self._students = []
+        self._students = {}
+        self._index = {}
+        self._next_ticket = 0
 
     def size(self) -> int:
         return len(self._students)
 
     def add(self, student: Student):
-        self._students.append(student)
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        self._students[ticket] = student
+        if isinstance(student, Student):
+            self._index.setdefault(student.student_number, []).append(ticket)
+
+    def _first_ticket(self, student: Student):
+        """
+        Returns the enrollment ticket of the first occurrence of a given Student if it exists. If it does not exist,
+        return None.
+
+        :param student: The student to search for
+        :type student: Student
+        :return: Ticket of the student, or None if it is not found
+        """
+        if not isinstance(student, Student):
+            return None
+        tickets = self._index.get(student.student_number)
+        if not tickets:
+            return None
+        return tickets[0]
 
     def _find(self, student: Student) -> int:
         """
@@ -27,8 +56,11 @@ class Course:
         :return: Index of the student, or -1 if it is not found
         :rtype: int
         """
-        for i, s in enumerate(self._students):
-            if s == student:
+        ticket = self._first_ticket(student)
+        if ticket is None:
+            return -1
+        for i, t in enumerate(self._students):
+            if t == ticket:
                 return i
         return -1
 
@@ -41,7 +73,26 @@ class Course:
         :return: True if the Student exists, False otherwise
         :rtype: bool
         """
-        return -1 != self._find(student)
+        return self._first_ticket(student) is not None
+
+    def _remove_first(self, student: Student) -> bool:
+        """
+        Remove the first occurrence of the specified student if it exists.
+
+        :param student: The student to be removed
+        :type student: Student
+        :return: True if the student was removed, False if it does not exist within the collection
+        :rtype: bool
+        """
+        ticket = self._first_ticket(student)
+        if ticket is None:
+            return False
+        tickets = self._index[student.student_number]
+        tickets.pop(0)
+        if not tickets:
+            del self._index[student.student_number]
+        del self._students[ticket]
+        return True
 
     def remove(self, student: Student):
         """
@@ -52,13 +103,56 @@ class Course:
         :param student: The student to be removed
         :type student: Student
         """
-        if not self.contains(student):
+        if not self._remove_first(student):
             raise ValueError("No such student to remove")
-        else:
-            self._students.pop(self._find(student))
+
+    def add_many(self, students):
+        """
+        Add every student from an iterable of students, in order, in a single pass.
+
+        :param students: The students to be added
+        :type students: An iterable of Students
+        """
+        students_by_ticket = self._students
+        index = self._index
+        ticket = self._next_ticket
+        for student in students:
+            students_by_ticket[ticket] = student
+            if isinstance(student, Student):
+                index.setdefault(student.student_number, []).append(ticket)
+            ticket += 1
+        self._next_ticket = ticket
+
+    def remove_many(self, students) -> list:
+        """
+        Remove the first occurrence of every student from an iterable of students, in order, in a single pass. Unlike
+        remove, a student that does not exist does not stop the removal of the others; it is reported instead. A
+        student listed twice removes two occurrences.
+
+        :param students: The students to be removed
+        :type students: An iterable of Students
+        :return: The students that could not be removed because they do not exist within the collection, in order
+        :rtype: list
+        """
+        remove_first = self._remove_first
+        return [student for student in students if not remove_first(student)]
+
+    def __iter__(self):
+        """
+        Iterate over the enrolled students in enrollment order.
+        """
+        return iter(self._students.values())
+
+    def write_roster(self, file):
+        """
+        Write the roster to a file-like object, one student per line in enrollment order. Each line is written as it
+        is produced, so the whole roster is never held in memory as a single string.
+
+        :param file: A file-like object opened for writing text
+        """
+        write = file.write
+        for student in self._students.values():
+            write(f"{student}\n")
 
     def __repr__(self) -> str:
-        s = ""
-        for student in self._students:
-            s += f"{student}\n"
-        return s
+        return "".join([f"{student}\n" for student in self._students.values()])
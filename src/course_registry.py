@@ -0,0 +1,116 @@
+from src.course import Course
+from src.student import Student
+
+
+class CourseRegistry:
+    """
+    A collection of Courses with an index from each student number to the courses that student is enrolled in, so
+    finding a student's courses does not require searching every course.
+
+    The index is only kept consistent with changes made through the registry; students should not be added to or
+    removed from a registered Course directly.
+    """
+
+    def __init__(self):
+        self._courses = {}
+        self._enrolments = {}
+
+    def size(self) -> int:
+        return len(self._courses)
+
+    def _index(self, course_name: str, student: Student):
+        if isinstance(student, Student):
+            enrolments = self._enrolments.setdefault(student.student_number, {})
+            enrolments[course_name] = enrolments.get(course_name, 0) + 1
+
+    def _unindex(self, course_name: str, student: Student):
+        enrolments = self._enrolments[student.student_number]
+        enrolments[course_name] -= 1
+        if enrolments[course_name] == 0:
+            del enrolments[course_name]
+            if not enrolments:
+                del self._enrolments[student.student_number]
+
+    def add_course(self, course: Course):
+        """
+        Register a course, indexing any students already enrolled in it.
+
+        :raise ValueError: If a course with the same name is already registered
+        :param course: The course to register
+        :type course: Course
+        """
+        if course.course_name in self._courses:
+            raise ValueError(f"Course {course.course_name} is already registered")
+        self._courses[course.course_name] = course
+        for student in course:
+            self._index(course.course_name, student)
+
+    def remove_course(self, course_name: str) -> Course:
+        """
+        Unregister a course and drop its students from the index.
+
+        :raise KeyError: If no course with the name is registered
+        :param course_name: Name of the course to unregister
+        :type course_name: str
+        :return: The unregistered course
+        :rtype: Course
+        """
+        course = self._courses.pop(course_name)
+        for student in course:
+            if isinstance(student, Student):
+                self._unindex(course_name, student)
+        return course
+
+    def get_course(self, course_name: str) -> Course:
+        """
+        Returns the registered course with the given name.
+
+        :raise KeyError: If no course with the name is registered
+        :param course_name: Name of the course
+        :type course_name: str
+        :return: The course
+        :rtype: Course
+        """
+        return self._courses[course_name]
+
+    def add(self, course_name: str, student: Student):
+        """
+        Enroll a student in a registered course.
+
+        :raise KeyError: If no course with the name is registered
+        :param course_name: Name of the course
+        :type course_name: str
+        :param student: The student to enroll
+        :type student: Student
+        """
+        self._courses[course_name].add(student)
+        self._index(course_name, student)
+
+    def remove(self, course_name: str, student: Student):
+        """
+        Remove the first occurrence of a student from a registered course.
+
+        :raise KeyError: If no course with the name is registered
+        :raise ValueError: If the student is not enrolled in the course
+        :param course_name: Name of the course
+        :type course_name: str
+        :param student: The student to remove
+        :type student: Student
+        """
+        self._courses[course_name].remove(student)
+        self._unindex(course_name, student)
+
+    def courses_for(self, student: Student) -> list:
+        """
+        Returns the names of the registered courses a student is enrolled in, in the order the student first enrolled
+        in them. This takes time proportional to the number of courses the student is in, not the number of courses or
+        enrolments in the registry.
+
+        :param student: The student to look up
+        :type student: Student
+        :return: Names of the student's courses
+        :rtype: list
+        """
+        if not isinstance(student, Student):
+            return []
+        return list(self._enrolments.get(student.student_number, ()))
@@ -0,0 +1,204 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from src.course import Course
+from src.student import Student
+
+# File layout, all integers little endian:
+#   header       magic, version, course name length, student count and name table length (see _HEADER)
+#   course name  UTF-8, padded with zero bytes to a multiple of 8 bytes
+#   numbers      one 64 bit signed integer per student
+#   offsets      2 * count + 1 unsigned 64 bit integers; student i's first name spans offsets[2i] to offsets[2i + 1]
+#                and their last name spans offsets[2i + 1] to offsets[2i + 2] within the name table
+#   names        every first and last name, UTF-8 encoded, one after the other
+_MAGIC = b"CS101CRS"
+_VERSION = 1
+_HEADER = struct.Struct("<8sHHIQQ")
+
+
+def _padding(length: int) -> int:
+    return -length % 8
+
+
+def save_course(course: Course, path: str):
+    """
+    Write a course of Students to a binary file that can be opened lazily with open_course.
+
+    :raise OverflowError: If a student number does not fit in a 64 bit signed integer
+    :param course: The course to save
+    :type course: Course
+    :param path: Path of the file to write
+    :type path: str
+    """
+    student_numbers = array("q")
+    names = bytearray()
+    name_offsets = array("Q", [0])
+    for student in course:
+        student_numbers.append(student.student_number)
+        names += student.first_name.encode()
+        name_offsets.append(len(names))
+        names += student.last_name.encode()
+        name_offsets.append(len(names))
+    if sys.byteorder != "little":
+        student_numbers.byteswap()
+        name_offsets.byteswap()
+
+    course_name = course.course_name.encode()
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, _VERSION, 0, len(course_name), len(student_numbers), len(names)))
+        file.write(course_name + bytes(_padding(len(course_name))))
+        file.write(student_numbers.tobytes())
+        file.write(name_offsets.tobytes())
+        file.write(names)
+
+
+class MappedCourse:
+    """
+    A read only course backed by a memory mapped file written by save_course. Opening the file only reads its header;
+    student numbers and names are read from the mapping when they are used and a Student object is only created for
+    a student that is actually retrieved.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open and memory map a course file.
+
+        :raise ValueError: If the file is not a course file
+        :param path: Path of the course file
+        :type path: str
+        """
+        if sys.byteorder != "little":
+            raise ValueError("Memory mapped courses require a little endian machine")
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, _, name_length, count, names_length = _HEADER.unpack_from(self._map)
+        except struct.error:
+            magic, version = None, None
+        if magic != _MAGIC or version != _VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {_VERSION} course file")
+
+        name_start = _HEADER.size
+        name_end = name_start + name_length
+        numbers_start = name_end + _padding(name_length)
+        offsets_start = numbers_start + 8 * count
+        names_start = offsets_start + 8 * (2 * count + 1)
+        names_end = names_start + names_length
+        if len(self._map) < names_end:
+            self._map.close()
+            raise ValueError(f"{path} is truncated")
+
+        self.course_name = self._map[name_start:name_end].decode()
+        self._buffer = memoryview(self._map)
+        self._student_numbers = self._buffer[numbers_start:offsets_start].cast("q")
+        self._name_offsets = self._buffer[offsets_start:names_start].cast("Q")
+        self._names = self._buffer[names_start:names_end]
+        self._index = None
+
+    def size(self) -> int:
+        return len(self._student_numbers)
+
+    def student_number(self, index: int) -> int:
+        """
+        Returns the student number of the student at the given index without creating a Student.
+
+        :param index: Index of the student
+        :type index: int
+        :return: The student number
+        :rtype: int
+        """
+        return self._student_numbers[index]
+
+    def get(self, index: int) -> Student:
+        """
+        Returns the student at the given index as a Student object.
+
+        :raise IndexError: If there is no student at the given index
+        :param index: Index of the student
+        :type index: int
+        :return: The student
+        :rtype: Student
+        """
+        student_number = self._student_numbers[index]
+        if index < 0:
+            index += len(self._student_numbers)
+        offsets = self._name_offsets
+        start, middle, end = offsets[2 * index], offsets[2 * index + 1], offsets[2 * index + 2]
+        first_name = bytes(self._names[start:middle]).decode()
+        last_name = bytes(self._names[middle:end]).decode()
+        return Student(first_name, last_name, student_number)
+
+    def _find(self, student: Student) -> int:
+        """
+        Returns the index of the first occurrence of a given Student if it exists. If it does not exist, return a
+        sentinel value of -1. The first search builds an index of the student numbers so later searches take constant
+        time.
+
+        :param student: The student to search for
+        :type student: Student
+        :return: Index of the student, or -1 if it is not found
+        :rtype: int
+        """
+        if not isinstance(student, Student):
+            return -1
+        if self._index is None:
+            index = {}
+            for i, student_number in enumerate(self._student_numbers):
+                index.setdefault(student_number, i)
+            self._index = index
+        return self._index.get(student.student_number, -1)
+
+    def contains(self, student: Student) -> bool:
+        """
+        Checks if a given student exists within the course.
+
+        :param student: The Student object to be checked if it exists within the course
+        :type student: Student
+        :return: True if the Student exists, False otherwise
+        :rtype: bool
+        """
+        return -1 != self._find(student)
+
+    def to_course(self) -> Course:
+        """
+        Create every Student and return them in a regular, modifiable Course.
+
+        :return: A Course with the same name and students
+        :rtype: Course
+        """
+        course = Course(self.course_name)
+        course.add_many(self.get(i) for i in range(self.size()))
+        return course
+
+    def close(self):
+        """
+        Release the memory mapping. The course can no longer be used once it is closed.
+        """
+        for view in (self._student_numbers, self._name_offsets, self._names, self._buffer):
+            view.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self) -> str:
+        return "".join([f"{self.get(i)}\n" for i in range(self.size())])
+
+
+def open_course(path: str) -> MappedCourse:
+    """
+    Open a course file written by save_course without loading its students.
+
+    :raise ValueError: If the file is not a course file
+    :param path: Path of the course file
+    :type path: str
+    :return: The memory mapped course
+    :rtype: MappedCourse
+    """
+    return MappedCourse(path)
@@ -0,0 +1,90 @@
+import heapq
+import pickle
+import tempfile
+from itertools import islice
+
+from src.sorting_topic import hybrid_sort
+
+# Number of items pickled together when a run is spilled to disk, and read back together during the merge
+SPILL_CHUNK_SIZE = 1000
+
+
+def _spill(run: list, directory: str):
+    """
+    Write a sorted run to an anonymous temporary file, which is deleted when it is closed.
+
+    :param run: The sorted run
+    :type run: list
+    :param directory: Directory for the temporary file, or None for the system default
+    :type directory: str
+    :return: The temporary file, positioned at its start
+    """
+    file = tempfile.TemporaryFile(dir=directory)
+    for start in range(0, len(run), SPILL_CHUNK_SIZE):
+        stop = start + SPILL_CHUNK_SIZE
+        pickle.dump(run[start:stop], file, pickle.HIGHEST_PROTOCOL)
+    file.seek(0)
+    return file
+
+
+def _read_run(file):
+    """
+    Yield the items of a spilled run, holding only one chunk of it in memory at a time.
+
+    :param file: The temporary file written by _spill
+    """
+    while True:
+        try:
+            chunk = pickle.load(file)
+        except EOFError:
+            return
+        yield from chunk
+
+
+def external_sort(iterable, key=None, reverse=False, max_run_size=100000, sort=hybrid_sort, directory=None):
+    """
+    Sort an iterable that may be too large to fit in memory. At most max_run_size items are read at a time and sorted
+    in memory with sort. If everything fits in one run it is returned directly, otherwise each sorted run is spilled
+    to a temporary file and the runs are merged with a heap, one item from each at a time. Like the sorts in
+    sorting_topic, the result is stable and key is called once per item while sorting runs.
+
+    Items must be picklable when the input does not fit in a single run. A file opened in text mode can be sorted
+    directly, as it is an iterable of lines.
+
+    :param iterable: The items to sort
+    :type iterable: Any iterable
+    :param key: Function computing the key to sort each item by, or None to sort the items themselves
+    :param reverse: Sort in descending rather than ascending order
+    :type reverse: bool
+    :param max_run_size: Maximum number of items held in memory while sorting runs
+    :type max_run_size: int
+    :param sort: The in memory sort used on each run, taking a list and key and reverse keywords
+    :param directory: Directory for the temporary files, or None for the system default
+    :type directory: str
+    :raise ValueError: If max_run_size is not positive
+    :return: A generator of the items in sorted order
+    """
+    if max_run_size < 1:
+        raise ValueError("max_run_size must be at least 1")
+    return _external_sort(iter(iterable), key, reverse, max_run_size, sort, directory)
+
+
+def _external_sort(iterator, key, reverse, max_run_size, sort, directory):
+    first_run = sort(list(islice(iterator, max_run_size)), key=key, reverse=reverse)
+    if len(first_run) < max_run_size:
+        yield from first_run
+        return
+
+    files = [_spill(first_run, directory)]
+    del first_run
+    try:
+        while True:
+            run = list(islice(iterator, max_run_size))
+            if not run:
+                break
+            files.append(_spill(sort(run, key=key, reverse=reverse), directory))
+            del run
+        yield from heapq.merge(*[_read_run(file) for file in files], key=key, reverse=reverse)
+    finally:
+        for file in files:
+            file.close()
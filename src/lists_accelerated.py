@@ -0,0 +1,143 @@
+from array import array
+
+from src.lists_topic import contains_while, index_of_for, my_sum
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Typecodes of the array.array types holding numbers; "u" arrays hold characters
+_NUMERIC_TYPECODES = set("bBhHiIlLqQfd")
+_FLOAT_TYPECODES = set("fd")
+
+
+def _as_ndarray(haystack):
+    """
+    Returns a NumPy view of a numeric haystack without copying it, or None if NumPy is not installed or the haystack
+    is not an ndarray or array.array of numbers.
+    """
+    if np is None:
+        return None
+    if isinstance(haystack, np.ndarray):
+        return haystack if haystack.dtype.kind in "biufc" else None
+    if isinstance(haystack, array) and haystack.typecode in _NUMERIC_TYPECODES and len(haystack) > 0:
+        return np.frombuffer(haystack, dtype=haystack.typecode)
+    return None
+
+
+def _widened(values):
+    """
+    Returns float and complex arrays at no less than double precision, copying them only if they are narrower, so that
+    single precision values are added in double precision.
+    """
+    if values.dtype.kind in "fc":
+        return values.astype(np.result_type(values.dtype, np.float64), copy=False)
+    return values
+
+
+def _vectorizable(needle, dtype) -> bool:
+    """
+    Checks if NumPy compares a needle with the elements of an array of the given type exactly, the way Python compares
+    an int with an int or a float with a float. That is the case for an int within the range of an integer array and
+    a float with an array of double precision floats. Comparing an int with floats, or a float with ints or narrower
+    floats, rounds one side first, so those are left to the loops.
+    """
+    if type(needle) is float:
+        return dtype == np.float64
+    if type(needle) is int and dtype.kind in "iu":
+        limits = np.iinfo(dtype)
+        return limits.min <= needle <= limits.max
+    return False
+
+
+def _matches(needle, haystack):
+    """
+    Compare every element of a numeric haystack with a number at once. Returns an array of booleans, or None if the
+    comparison cannot be vectorized without changing the result.
+    """
+    values = _as_ndarray(haystack)
+    if values is None or not _vectorizable(needle, values.dtype):
+        return None
+    return values.ravel() == needle
+
+
+def contains_fast(needle, haystack) -> bool:
+    """
+    Linear search that avoids looping in Python where it can, with the same result as contains_while. When NumPy is
+    installed, an int is compared with every element of a NumPy array, or an array.array, of integers in one
+    vectorized comparison, and so is a float with an array of double precision floats. Lists, tuples and array.array
+    types are otherwise searched with their own loop written in C. Any other haystack, including a NumPy array the
+    needle cannot be compared with exactly in one go, is searched with contains_while.
+
+    A needle that is not equal to itself, such as NaN, is never found, as with contains_while.
+
+    :param needle: Element to look for
+    :type needle: Some arbitrary type
+    :param haystack: Sequence to search through
+    :type haystack: A list, tuple, array.array, NumPy array or other sequence
+    :return: True if needle is contained in haystack, false otherwise
+    :rtype: Boolean
+    """
+    matches = _matches(needle, haystack)
+    if matches is not None:
+        return bool(matches.any())
+    if isinstance(haystack, (list, tuple, array)) and needle == needle:
+        return needle in haystack
+    return contains_while(needle, haystack)
+
+
+def index_of_fast(needle, haystack) -> int:
+    """
+    Linear search that avoids looping in Python where it can, with the same result as index_of_for. When NumPy is
+    installed, an int is compared with every element of a NumPy array, or an array.array, of integers in one
+    vectorized comparison, and so is a float with an array of double precision floats, and the first match is found
+    with argmax. Lists, tuples and array.array types are otherwise searched with their own index method, written in
+    C. Any other haystack, including a NumPy array the needle cannot be compared with exactly in one go, is searched
+    with index_of_for.
+
+    :param needle: Element to look for
+    :type needle: Some arbitrary type
+    :param haystack: Sequence to search through
+    :type haystack: A list, tuple, array.array, NumPy array or other iterable
+    :return: Index of the first occurrence of needle within haystack if it is found, -1 otherwise
+    :rtype: Integer
+    """
+    matches = _matches(needle, haystack)
+    if matches is not None:
+        if matches.size == 0:
+            return -1
+        index = int(matches.argmax())
+        return index if matches[index] else -1
+    if isinstance(haystack, (list, tuple, array)) and needle == needle:
+        try:
+            return haystack.index(needle)
+        except ValueError:
+            return -1
+    return index_of_for(needle, haystack)
+
+
+def my_sum_fast(a_list):
+    """
+    Sum that avoids looping in Python where it can. NumPy arrays of numbers, and array.array types of floats when
+    NumPy is installed, are summed with NumPy's vectorized sum. Floats are added in double precision even when they
+    are stored in single precision. NumPy adds them pairwise, so the result can differ from my_sum in the last digits,
+    and it adds integers in the array's own fixed width type, which can overflow.
+    Integer array.array types are therefore summed with the built in sum, which never overflows. Other iterables of
+    numbers are also summed with the built in sum, which adds them in order like my_sum but in C. From Python 3.12 it
+    compensates for rounding when adding floats, so its result can be slightly more accurate than my_sum's.
+
+    :param a_list: Some numbers to be added together
+    :type a_list: A list, tuple, array.array, NumPy array or other iterable of numbers
+    :return: The sum of the numbers
+    :rtype: Float
+    """
+    if np is not None and isinstance(a_list, np.ndarray):
+        if a_list.dtype.kind in "biufc":
+            return _widened(a_list).sum().item()
+        return my_sum(a_list.ravel())
+    if isinstance(a_list, array) and a_list.typecode in _FLOAT_TYPECODES:
+        values = _as_ndarray(a_list)
+        if values is not None:
+            return values.sum(dtype=np.float64).item()
+    return sum(a_list)
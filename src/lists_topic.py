@@ -1,3 +1,7 @@
+from itertools import islice
+from math import fsum, inf
+
+
 def contains_while(needle, haystack) -> bool:
     """
     Linear search on a list. Return true if needle is found within haystack and false if it is not. Note that type
@@ -59,24 +63,354 @@ assert 3 == index_of_for(False, ["a", 1, 2.0, False])
 assert 1 == index_of_for(1, ["a", 1, 1, 2.0, False])
 
 
-def my_sum(a_list) -> float:
+def lower_bound(needle, haystack) -> int:
     """
-    Calculates and returns the sum of the contents of the provided list.
+    Binary search on a sorted list. Return the index of the first element of haystack that is not less than needle,
+    which is where needle would be inserted to keep haystack sorted before any equal elements. If every element is
+    less than needle, return the length of haystack. Each step halves the part of the list left to search, so at
+    most about log2(n) + 1 elements are compared.
 
-    :param a_list:  Some list of numbers to be added together
-    :type a_list: A list of some type that can be added together
-    :return: The sum of the contents of the list
-    :rtype: Float
+    :param needle: Element to look for
+    :type needle: Some arbitrary type that can be compared with the elements of haystack
+    :param haystack: Sorted list to search through
+    :type haystack: A list sorted in ascending order
+    :return: Index of the first element not less than needle
+    :rtype: Integer
+    """
+    low = 0
+    high = len(haystack)
+    while low < high:
+        middle = (low + high) // 2
+        if haystack[middle] < needle:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+# lower_bound tests
+assert 0 == lower_bound(1, [])
+assert 0 == lower_bound(0, [1, 2, 2, 3])
+assert 1 == lower_bound(2, [1, 2, 2, 3])
+assert 4 == lower_bound(4, [1, 2, 2, 3])
+
+
+def upper_bound(needle, haystack) -> int:
+    """
+    Binary search on a sorted list. Return the index of the first element of haystack that is greater than needle,
+    which is where needle would be inserted to keep haystack sorted after any equal elements. If no element is
+    greater than needle, return the length of haystack.
+
+    :param needle: Element to look for
+    :type needle: Some arbitrary type that can be compared with the elements of haystack
+    :param haystack: Sorted list to search through
+    :type haystack: A list sorted in ascending order
+    :return: Index of the first element greater than needle
+    :rtype: Integer
+    """
+    low = 0
+    high = len(haystack)
+    while low < high:
+        middle = (low + high) // 2
+        if needle < haystack[middle]:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+# upper_bound tests
+assert 0 == upper_bound(1, [])
+assert 0 == upper_bound(0, [1, 2, 2, 3])
+assert 3 == upper_bound(2, [1, 2, 2, 3])
+assert 4 == upper_bound(3, [1, 2, 2, 3])
+
+
+def contains_sorted(needle, haystack) -> bool:
+    """
+    Binary search on a sorted list. Return true if needle is found within haystack and false if it is not. Unlike
+    contains_while this only takes O(log n) time, but haystack must be sorted in ascending order.
+
+    :param needle: Element to look for
+    :type needle: Some arbitrary type that can be compared with the elements of haystack
+    :param haystack: Sorted list to search through
+    :type haystack: A list sorted in ascending order
+    :return: True if needle is contained in haystack, false otherwise
+    :rtype: Boolean
+    """
+    index = lower_bound(needle, haystack)
+    return index < len(haystack) and haystack[index] == needle
+
+
+# contains_sorted tests
+assert not contains_sorted("a", [])
+assert not contains_sorted(4, [1, 2, 3, 5])
+assert contains_sorted(1, [1, 2, 3, 5])
+assert contains_sorted(5, [1, 2, 3, 5])
+
+
+def index_of_sorted(needle, haystack) -> int:
+    """
+    Binary search on a sorted list. Return the index of the first occurence of needle if it is found within haystack
+    and -1 if it is not. Unlike index_of_for this only takes O(log n) time, but haystack must be sorted in ascending
+    order.
+
+    :param needle: Element to look for
+    :type needle: Some arbitrary type that can be compared with the elements of haystack
+    :param haystack: Sorted list to search through
+    :type haystack: A list sorted in ascending order
+    :return: Index of the needle within haystack if it is found, -1 otherwise
+    :rtype: Integer
+    """
+    index = lower_bound(needle, haystack)
+    if index < len(haystack) and haystack[index] == needle:
+        return index
+    return -1
+
+
+# index_of_sorted tests
+assert -1 == index_of_sorted("a", [])
+assert -1 == index_of_sorted(4, [1, 2, 3, 5])
+assert 0 == index_of_sorted(1, [1, 2, 3, 5])
+assert 3 == index_of_sorted(5, [1, 2, 3, 5])
+assert 1 == index_of_sorted(2, [1, 2, 2, 2, 3])
+
+
+def _index_sorted_many(needles, haystack) -> list:
+    """
+    Find the first index of every needle in a single merge pass over both lists, which must be sorted in ascending
+    order. The position in haystack only ever moves forward, so this takes O(m + n) time.
+    """
+    indices = []
+    position = 0
+    for needle in needles:
+        while position < len(haystack) and haystack[position] < needle:
+            position += 1
+        if position < len(haystack) and haystack[position] == needle:
+            indices.append(position)
+        else:
+            indices.append(-1)
+    return indices
+
+
+def _first_occurrences(haystack) -> tuple:
+    """
+    Build a dictionary from each element of haystack to the index of its first occurrence, in one pass. Unhashable
+    elements, such as lists, cannot be put in the dictionary and are returned separately with their index.
+    """
+    first_index = {}
+    unhashables = []
+    for index, thing in enumerate(haystack):
+        try:
+            first_index.setdefault(thing, index)
+        except TypeError:
+            unhashables.append((index, thing))
+    return first_index, unhashables
+
+
+def _index_hashed_many(needles, haystack) -> list:
     """
+    Find the first index of every needle by looking it up in a dictionary of first occurrences, also checking it
+    against any unhashable elements of haystack that come earlier. An unhashable needle, or one like NaN that the
+    dictionary finds but that is not equal to itself, falls back to a linear search.
+    """
+    first_index, unhashables = _first_occurrences(haystack)
+    indices = []
+    for needle in needles:
+        try:
+            found = first_index.get(needle, -1)
+        except TypeError:
+            found = None
+        if found is None or (found != -1 and not haystack[found] == needle):
+            indices.append(index_of_for(needle, haystack))
+            continue
+        for index, thing in unhashables:
+            if found != -1 and index > found:
+                break
+            if thing == needle:
+                found = index
+                break
+        indices.append(found)
+    return indices
+
+
+def index_of_many(needles, haystack, both_sorted=False) -> list:
+    """
+    Batch linear search. Return, for every needle, the index of its first occurence within haystack or -1 if it is
+    not found, exactly as index_of_for would. Rather than searching haystack once per needle, which takes O(m * n)
+    time, haystack is searched once for all the needles: either through a dictionary of first occurrences built in one
+    pass or, when both lists are sorted, in a single merge pass over both.
+
+    :param needles: Elements to look for
+    :type needles: A list of arbitrary types
+    :param haystack: List to search through
+    :type haystack: A list of arbitrary types
+    :param both_sorted: True if needles and haystack are both sorted in ascending order
+    :type both_sorted: Boolean
+    :return: Index of each needle within haystack if it is found, -1 otherwise, in the order of needles
+    :rtype: A list of integers
+    """
+    if both_sorted:
+        return _index_sorted_many(needles, haystack)
+    return _index_hashed_many(needles, haystack)
+
+
+# index_of_many tests
+assert [] == index_of_many([], ["a", 1])
+assert [-1, -1] == index_of_many(["a", []], [])
+assert [0, 1, -1, 3] == index_of_many(["a", 1, "b", False], ["a", 1, 2.0, False])
+assert [1, 2] == index_of_many([[1], [2]], ["a", [1], [2], [1]])
+assert [0, 2] == index_of_many([1, "b"], [True, [1], "b", 1])
+assert [1, -1, 3] == index_of_many([2, 3, 5], [1, 2, 2, 5], both_sorted=True)
+
+
+def contains_many(needles, haystack, both_sorted=False) -> list:
+    """
+    Batch linear search. Return, for every needle, true if it is found within haystack and false if it is not, exactly
+    as contains_while would, but searching haystack once for all the needles. See index_of_many.
+
+    :param needles: Elements to look for
+    :type needles: A list of arbitrary types
+    :param haystack: List to search through
+    :type haystack: A list of arbitrary types
+    :param both_sorted: True if needles and haystack are both sorted in ascending order
+    :type both_sorted: Boolean
+    :return: True if the needle is contained in haystack, false otherwise, in the order of needles
+    :rtype: A list of booleans
+    """
+    return [index != -1 for index in index_of_many(needles, haystack, both_sorted)]
+
+
+# contains_many tests
+assert [] == contains_many([], [])
+assert [False, True, True] == contains_many(["b", "a", False], ["a", 1, 2.0, False])
+assert [True, False] == contains_many([1, 3], [1, 2], both_sorted=True)
+
+
+# Number of values added one after the other before pairwise summation starts adding sums in pairs
+PAIRWISE_CHUNK_SIZE = 128
+
+
+def _sum_naive(values):
     sum = 0
-    for value in a_list:
+    for value in values:
         sum += value
     return sum
 
 
+def _sum_compensated(values):
+    """
+    Neumaier's improvement of Kahan summation. The rounding error of every addition is worked out exactly and kept in
+    a separate running compensation, which is added back at the end. The error no longer grows with the number of
+    values, at the cost of a few more operations per value.
+    """
+    sum = 0
+    compensation = 0
+    for value in values:
+        new_sum = sum + value
+        if abs(sum) >= abs(value):
+            compensation += (sum - new_sum) + value
+        else:
+            compensation += (value - new_sum) + sum
+        sum = new_sum
+    if sum in (inf, -inf) or sum != sum:
+        # The compensation of an infinite sum is meaningless (inf - inf is NaN)
+        return sum
+    return sum + compensation
+
+
+def _sum_pairwise(values):
+    """
+    Pairwise summation of an iterable, without holding more than one chunk of it in memory. Each chunk of values is
+    added up, then sums covering the same number of chunks are added in pairs, like carrying in a binary counter, so
+    the stack of partial sums only grows with the logarithm of the number of chunks. The error grows with log(n)
+    rather than n.
+    """
+    iterator = iter(values)
+    stack = []
+    while True:
+        chunk = list(islice(iterator, PAIRWISE_CHUNK_SIZE))
+        if not chunk:
+            break
+        chunk_sum, chunks = _sum_naive(chunk), 1
+        while stack and stack[-1][1] == chunks:
+            partial_sum, partial_chunks = stack.pop()
+            chunk_sum, chunks = partial_sum + chunk_sum, partial_chunks + chunks
+        stack.append((chunk_sum, chunks))
+    sum = 0
+    while stack:
+        sum = stack.pop()[0] + sum
+    return sum
+
+
+def _sum_exact(values):
+    """
+    Adds the ints exactly, as the plain loop does, and everything else with math.fsum, which returns the correctly
+    rounded sum of the floats. fsum converts every value to a float, so giving it the ints as well would round large
+    ints. The result is only a float when there was a value that is not an int.
+    """
+    integer_sum = 0
+    has_non_integer = False
+
+    def non_integers():
+        nonlocal integer_sum, has_non_integer
+        for value in values:
+            if isinstance(value, int):
+                integer_sum += value
+            else:
+                has_non_integer = True
+                yield value
+
+    float_sum = fsum(non_integers())
+    if not has_non_integer:
+        return integer_sum
+    return float_sum + integer_sum
+
+
+SUM_MODES = {
+    "naive": _sum_naive,
+    "exact": _sum_exact,
+    "compensated": _sum_compensated,
+    "pairwise": _sum_pairwise,
+}
+
+
+def my_sum(a_list, mode="naive") -> float:
+    """
+    Calculates and returns the sum of the contents of the provided list. Adding floats one after the other rounds
+    every partial sum, and over millions of values the rounding errors add up. The mode picks how the values are added:
+
+    naive        one after the other (the default)
+    exact        ints exactly and floats with math.fsum, which returns their correctly rounded sum
+    compensated  one after the other while keeping track of the rounding errors (Neumaier's version of Kahan's method)
+    pairwise     in chunks whose sums are then added in pairs
+
+    Every mode reads the values once, in order, so any iterable can be summed, including an iterator too large to
+    hold in memory.
+
+    :param a_list:  Some list of numbers to be added together
+    :type a_list: A list, or any iterable, of some type that can be added together
+    :param mode: How to add the values, one of "naive", "exact", "compensated" or "pairwise"
+    :type mode: String
+    :raise ValueError: If the mode is not one of the modes above
+    :return: The sum of the contents of the list
+    :rtype: Float
+    """
+    if mode not in SUM_MODES:
+        raise ValueError(f"Unknown mode {mode}, expected one of {list(SUM_MODES)}")
+    return SUM_MODES[mode](a_list)
+
+
 # my_sum tests
 assert 0 == my_sum([])
 assert 0 == my_sum([0, 0])
 assert 1 == my_sum([1])
 assert 0 == my_sum([1, -1])
 assert 15 == my_sum([0, 1, 2, 3, 4, 5])
+assert 0 == my_sum([], "exact")
+assert 10**20 + 1 == my_sum([10**20, 1], "exact")
+assert 15 == my_sum(iter([0, 1, 2, 3, 4, 5]), "compensated")
+assert 499500 == my_sum(iter(range(1000)), "pairwise")
+assert 0.0 == my_sum([1e100, 1.0, -1e100])
+assert 1.0 == my_sum([1e100, 1.0, -1e100], "exact")
+assert 1.0 == my_sum([1e100, 1.0, -1e100], "compensated")
@@ -0,0 +1,126 @@
+import os
+import random
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.sharedctypes import RawArray
+
+# Number of sampled values per worker used to choose the splitters between buckets
+OVERSAMPLING = 64
+
+# The shared values and output of the sort, set in each worker process when the pool starts
+_values = None
+_output = None
+
+
+def _shared_view(buffer, typecode: str) -> memoryview:
+    return memoryview(buffer).cast("B").cast(typecode)
+
+
+def _init_worker(values_buffer, output_buffer, typecode: str):
+    global _values, _output
+    _values = _shared_view(values_buffer, typecode)
+    _output = _shared_view(output_buffer, typecode)
+
+
+def _sort_chunk(typecode: str, start: int, stop: int, splitters: list, sort) -> list:
+    """
+    Sort one chunk of the shared values in place and find where each splitter falls within it.
+
+    :return: Positions in the shared values where each bucket of the chunk starts, followed by the end of the chunk
+    :rtype: list
+    """
+    chunk = sort(_values[start:stop].tolist())
+    _values[start:stop] = array(typecode, chunk)
+    return [start] + [start + bisect_right(chunk, splitter) for splitter in splitters] + [stop]
+
+
+def _sort_bucket(typecode: str, segments: list, offset: int, sort):
+    """
+    Gather one bucket's segment from every sorted chunk, sort them together and write the bucket to its place in the
+    shared output. The segments are gathered in chunk order, so a stable sort keeps equal values in input order.
+    """
+    bucket = []
+    for start, stop in segments:
+        bucket.extend(_values[start:stop].tolist())
+    stop = offset + len(bucket)
+    _output[offset:stop] = array(typecode, sort(bucket))
+
+
+# Typecodes of the arrays that can hold every int or float they are given exactly, by the type of value they hold
+_TYPECODES = {int: "q", float: "d"}
+
+
+def _typecode_for(values, typecode: str) -> str:
+    """
+    Returns the typecode to store the values as, inferring it from the type of the values if typecode is None.
+
+    :raise TypeError: If the values are not all of the type the typecode holds, or are not all ints or all floats
+    """
+    types = set(map(type, values))
+    if typecode is None:
+        if len(types) > 1 or not types <= _TYPECODES.keys():
+            raise TypeError("parallel_sort needs the values to be all ints or all floats")
+        return _TYPECODES[types.pop()] if types else "d"
+    value_type = int if typecode in "bBhHiIlLqQ" else float
+    if not types <= {value_type}:
+        raise TypeError(f"Typecode {typecode} can only hold {value_type.__name__} values")
+    return typecode
+
+
+def parallel_sort(values, workers: int = None, typecode: str = None, sort=sorted) -> list:
+    """
+    Sort a list of numbers across a pool of worker processes using sample sort. The values are copied once into a
+    shared memory buffer that the workers read and write directly, rather than being pickled to them. Each worker
+    sorts a chunk of the buffer in place, splitters sampled from the values cut every chunk into one segment per
+    bucket, and each worker then sorts one bucket's segments into its final place in a shared output buffer.
+
+    Chunks and buckets are sorted with sort. When sort is stable, such as sorted or merge_sort, the result is
+    exactly what sorting the whole list with sort would give.
+
+    :param values: The numbers to sort. They must not contain NaN.
+    :type values: list
+    :param workers: Number of worker processes, defaults to the number of CPUs
+    :type workers: int
+    :param typecode: The array typecode the values are stored as while sorting, such as "d" for floats or "q" for
+        integers. Defaults to "q" if the values are all ints and "d" if they are all floats.
+    :type typecode: str
+    :param sort: Function returning a sorted list of the numbers in a list
+    :raise ValueError: If workers is not positive
+    :raise TypeError: If the values are not all of the type the typecode holds, or are not all ints or all floats
+    :raise OverflowError: If an int does not fit in the typecode
+    :return: A new sorted list
+    :rtype: list
+    """
+    if workers is None:
+        workers = os.cpu_count()
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    typecode = _typecode_for(values, typecode)
+    if workers == 1 or len(values) < 2 * workers:
+        return sort(list(values))
+
+    values = array(typecode, values)
+    size = len(values)
+    sample = sorted(values[i] for i in random.Random(size).sample(range(size), min(size, OVERSAMPLING * workers)))
+    splitters = [sample[len(sample) * k // workers] for k in range(1, workers)]
+
+    values_buffer = RawArray(typecode, size)
+    output_buffer = RawArray(typecode, size)
+    _shared_view(values_buffer, typecode)[:] = values
+    del values
+
+    starts = [size * k // workers for k in range(workers)]
+    stops = starts[1:] + [size]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(values_buffer, output_buffer, typecode)
+    ) as executor:
+        chunk_bounds = list(
+            executor.map(_sort_chunk, [typecode] * workers, starts, stops, [splitters] * workers, [sort] * workers)
+        )
+        buckets = [[(bounds[b], bounds[b + 1]) for bounds in chunk_bounds] for b in range(workers)]
+        offsets = [0]
+        for bucket in buckets[:-1]:
+            offsets.append(offsets[-1] + sum(stop - start for start, stop in bucket))
+        list(executor.map(_sort_bucket, [typecode] * workers, buckets, offsets, [sort] * workers))
+    return _shared_view(output_buffer, typecode).tolist()
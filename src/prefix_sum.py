@@ -0,0 +1,142 @@
+from itertools import accumulate
+
+
+def _bounds(start, stop, size: int) -> tuple:
+    """
+    Clamp start and stop the way slicing a list of the given size does, with None and negative indices allowed.
+    """
+    start, stop, _ = slice(start, stop).indices(size)
+    return start, max(start, stop)
+
+
+class PrefixSums:
+    """
+    The running totals of a list of numbers, so the sum of any range of the list takes O(1) time instead of adding up
+    the range every time. Building it takes O(n) time; it does not see later changes to the list, see FenwickTree for
+    numbers that change.
+
+    range_sum(start, stop) gives the same sum as my_sum(a_list[start:stop]) only for numbers that are added exactly,
+    such as ints or Fractions. It subtracts two running totals rather than adding the range on its own, so with floats
+    the rounding of a large total can swallow a small range: for [1e17, 0.5, 0.25] the range from 1 to 3 sums to 0.0
+    rather than 0.75.
+    """
+
+    def __init__(self, values):
+        self._totals = list(accumulate(values, initial=0))
+
+    def size(self) -> int:
+        return len(self._totals) - 1
+
+    def range_sum(self, start=None, stop=None):
+        """
+        Returns the sum of the values from index start up to, but not including, index stop. The indices work like
+        a slice: they may be None or negative and are clamped to the list.
+
+        :param start: Index of the first value in the range
+        :type start: int
+        :param stop: Index after the last value in the range
+        :type stop: int
+        :return: The sum of the range
+        """
+        start, stop = _bounds(start, stop, self.size())
+        return self._totals[stop] - self._totals[start]
+
+    def __repr__(self) -> str:
+        return f"PrefixSums(size={self.size()}, total={self._totals[-1]})"
+
+
+class FenwickTree:
+    """
+    A Fenwick (binary indexed) tree over a list of numbers. Entry i of the tree holds the sum of the values in a
+    range ending at value i whose length is the lowest set bit of i, so any running total, and therefore any range
+    sum, is built from at most log2(n) entries and changing a value updates at most log2(n) entries. Building it takes
+    O(n) time.
+
+    range_sum(start, stop) gives the same sum as my_sum(a_list[start:stop]) only for numbers that are added exactly,
+    such as ints or Fractions. With floats, as with PrefixSums, the rounding of the large sums held by the tree can
+    swallow a small range next to large values.
+    """
+
+    def __init__(self, values):
+        self._values = list(values)
+        tree = [0] + self._values
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def size(self) -> int:
+        return len(self._values)
+
+    def _index(self, index: int) -> int:
+        if not -len(self._values) <= index < len(self._values):
+            raise IndexError("FenwickTree index out of range")
+        return index % len(self._values)
+
+    def get(self, index: int):
+        """
+        Returns the value at the given index.
+
+        :raise IndexError: If there is no value at the given index
+        :param index: Index of the value
+        :type index: int
+        :return: The value
+        """
+        return self._values[index]
+
+    def add(self, index: int, amount):
+        """
+        Add an amount to the value at the given index in O(log n) time.
+
+        :raise IndexError: If there is no value at the given index
+        :param index: Index of the value
+        :type index: int
+        :param amount: The amount to add to the value
+        """
+        index = self._index(index)
+        self._values[index] += amount
+        tree = self._tree
+        i = index + 1
+        while i < len(tree):
+            tree[i] += amount
+            i += i & -i
+
+    def set(self, index: int, value):
+        """
+        Replace the value at the given index in O(log n) time.
+
+        :raise IndexError: If there is no value at the given index
+        :param index: Index of the value
+        :type index: int
+        :param value: The new value
+        """
+        self.add(index, value - self._values[self._index(index)])
+
+    def _total(self, stop: int):
+        """
+        Returns the sum of the first stop values.
+        """
+        tree = self._tree
+        total = 0
+        while stop > 0:
+            total += tree[stop]
+            stop -= stop & -stop
+        return total
+
+    def range_sum(self, start=None, stop=None):
+        """
+        Returns the sum of the values from index start up to, but not including, index stop, in O(log n) time. The
+        indices work like a slice: they may be None or negative and are clamped to the list.
+
+        :param start: Index of the first value in the range
+        :type start: int
+        :param stop: Index after the last value in the range
+        :type stop: int
+        :return: The sum of the range
+        """
+        start, stop = _bounds(start, stop, self.size())
+        return self._total(stop) - self._total(start)
+
+    def __repr__(self) -> str:
+        return f"FenwickTree({self._values})"
@@ -0,0 +1,103 @@
+from bisect import bisect_left, bisect_right, insort_right
+
+
+class SortedList:
+    """
+    A list that keeps its elements in ascending order as they are added, so checking whether it contains an element
+    or finding an element's index is a binary search taking O(log n) time rather than a linear scan. Adding or
+    removing an element still moves the elements after it, which takes O(n) time, so it suits lists that are
+    searched far more often than they change.
+
+    Equal elements are kept in the order they were added.
+    """
+
+    def __init__(self, elements=()):
+        self._elements = sorted(elements)
+
+    def size(self) -> int:
+        return len(self._elements)
+
+    def add(self, element):
+        """
+        Add an element at its place in the order, after any equal elements.
+
+        :param element: The element to add
+        """
+        insort_right(self._elements, element)
+
+    def add_many(self, elements):
+        """
+        Add every element from an iterable of elements. The new elements are sorted together with the existing ones in
+        one pass, which is faster than adding them one at a time.
+
+        :param elements: The elements to add
+        :type elements: An iterable of elements
+        """
+        self._elements.extend(elements)
+        self._elements.sort()
+
+    def index_of(self, element) -> int:
+        """
+        Returns the index of the first occurrence of an element if it exists. If it does not exist, return a sentinel
+        value of -1.
+
+        :param element: The element to search for
+        :return: Index of the element, or -1 if it is not found
+        :rtype: int
+        """
+        index = bisect_left(self._elements, element)
+        if index < len(self._elements) and self._elements[index] == element:
+            return index
+        return -1
+
+    def contains(self, element) -> bool:
+        """
+        Checks if an element exists within the list.
+
+        :param element: The element to be checked if it exists within the list
+        :return: True if the element exists, False otherwise
+        :rtype: bool
+        """
+        return -1 != self.index_of(element)
+
+    def count(self, element) -> int:
+        """
+        Returns the number of occurrences of an element.
+
+        :param element: The element to count
+        :return: The number of elements equal to it
+        :rtype: int
+        """
+        return bisect_right(self._elements, element) - bisect_left(self._elements, element)
+
+    def remove(self, element):
+        """
+        Remove the first occurrence of an element. If the element does not exist, raise an exception.
+
+        :raise ValueError: If the element does not exist within the list
+        :param element: The element to be removed
+        """
+        index = self.index_of(element)
+        if index == -1:
+            raise ValueError("No such element to remove")
+        del self._elements[index]
+
+    def get(self, index: int):
+        """
+        Returns the element at the given index in ascending order.
+
+        :raise IndexError: If there is no element at the given index
+        :param index: Index of the element
+        :type index: int
+        :return: The element
+        """
+        return self._elements[index]
+
+    def __iter__(self):
+        """
+        Iterate over the elements in ascending order.
+        """
+        return iter(self._elements)
+
+    def __repr__(self) -> str:
+        return f"SortedList({self._elements})"
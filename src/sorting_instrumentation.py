@@ -0,0 +1,160 @@
+import inspect
+import time
+import tracemalloc
+
+from src.sorting_topic import counting_sort, radix_sort
+
+# Sorts that place elements by their integer keys rather than by comparing them, so they are given the elements as
+# they are instead of wrapped in probes
+INTEGER_SORTS = {counting_sort, radix_sort}
+
+
+class SortReport:
+    """
+    Counts and measurements from an instrumented run of a sorting function.
+
+    comparisons  number of comparisons between elements (or between keys, when a key is given)
+    swaps        number of times two elements were swapped
+    passes       number of passes the sort made over the collection, or over the part of it left to sort
+    moves        number of times an element was moved to a new position, counting the elements that inserting into or
+                 removing from a list shifts along
+    peak_bytes   peak memory allocated while sorting
+    seconds      time taken to sort, measured on a separate uninstrumented run
+    """
+
+    def __init__(self, algorithm: str, size: int):
+        self.algorithm = algorithm
+        self.size = size
+        self.comparisons = 0
+        self.swaps = 0
+        self.passes = 0
+        self.moves = 0
+        self.peak_bytes = 0
+        self.seconds = 0.0
+        self.result = None
+
+    def as_dict(self) -> dict:
+        """
+        Returns the report as a dictionary of plain values, without the sorted result, for writing out as JSON.
+
+        :return: The report
+        :rtype: dict
+        """
+        return {
+            "algorithm": self.algorithm,
+            "size": self.size,
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+            "passes": self.passes,
+            "moves": self.moves,
+            "peak_bytes": self.peak_bytes,
+            "seconds": self.seconds,
+        }
+
+    def __repr__(self) -> str:
+        return f"SortReport({self.as_dict()})"
+
+
+class _Probe:
+    """
+    Wraps an element or key and counts every ordering comparison made with it in a report. Equality tests are not
+    counted: when a key is given or the order is reversed, the sort compares (key, position, element) tuples, and
+    comparing two tuples tests their keys for equality before ordering them, which would count each comparison twice.
+    """
+
+    __slots__ = ("value", "report")
+
+    def __init__(self, value, report: SortReport):
+        self.value = value
+        self.report = report
+
+    def __lt__(self, other):
+        self.report.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        self.report.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        self.report.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        self.report.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        return isinstance(other, _Probe) and self.value == other.value
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+
+def _count(sort, collection, key, reverse, report: SortReport):
+    """
+    Sort the collection with every element, or key, wrapped in a probe counting comparisons, while the sort counts its
+    own swaps, moves and passes in the report. The sorted result is added to the report.
+    """
+    if sort in INTEGER_SORTS:
+        report.result = sort(list(collection), key=key, reverse=reverse, counter=report)
+        return
+    if key is None:
+        probes = [_Probe(element, report) for element in collection]
+        probe_key = None
+    else:
+        probes = [_Probe(element, None) for element in collection]
+
+        def probe_key(probe):
+            return _Probe(key(probe.value), report)
+
+    result = sort(probes, key=probe_key, reverse=reverse, counter=report)
+    # Sorts working in place return None, leaving the sorted probes in the list they were given
+    if result is None:
+        result = probes
+    report.result = [probe.value for probe in result]
+
+
+def instrument(sort, collection, key=None, reverse=False, hook=None) -> SortReport:
+    """
+    Run a sorting function with instrumentation and report what it did. The sort counts its own swaps, moves and
+    passes in the counter it is given; without one, as whenever it is not called through this function, it counts
+    nothing.
+
+    The collection is sorted three times, each on a copy: once untouched to time it, once under tracemalloc to measure
+    its peak memory, and once counting, with every element wrapped to count comparisons unless the sort places
+    elements by their integer keys.
+
+    :raise ValueError: If the sort does not take a counter, such as auto_sort, which picks another sort to use
+    :param sort: A sorting function from sorting_topic taking a list and key, reverse and counter keywords
+    :param collection: The collection to sort; it is not modified
+    :type collection: list
+    :param key: Function computing the key to sort each element by, or None
+    :param reverse: Sort in descending rather than ascending order
+    :type reverse: bool
+    :param hook: Function called with the finished report, for example to log or collect timings
+    :return: The report, with the sorted list in its result attribute
+    :rtype: SortReport
+    """
+    if "counter" not in inspect.signature(sort).parameters:
+        raise ValueError(f"{sort.__name__} does not count its work, instrument the sort it uses instead")
+    report = SortReport(sort.__name__, len(collection))
+
+    copy = list(collection)
+    start = time.perf_counter()
+    sort(copy, key=key, reverse=reverse)
+    report.seconds = time.perf_counter() - start
+
+    copy = list(collection)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    sort(copy, key=key, reverse=reverse)
+    report.peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    _count(sort, collection, key, reverse, report)
+    if hook is not None:
+        hook(report)
+    return report
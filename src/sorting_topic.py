@@ -1,44 +1,392 @@
-def selection_sort(collection):
+import heapq
+import random
+from bisect import bisect_right
+
+
+def _decorate(collection, key, reverse):
+    # Decorate each element with its key, computed once, and its position. The position breaks ties between equal
+    # keys, so elements themselves are never compared. When reversing, positions are negated so that sorting
+    # ascending and then flipping the result keeps elements with equal keys in their original order.
+    if key is None:
+        return [(element, -i if reverse else i, element) for i, element in enumerate(collection)]
+    return [(key(element), -i if reverse else i, element) for i, element in enumerate(collection)]
+
+
+def _sort_decorated(sort, collection, key, reverse, counter=None):
+    decorated = sort(_decorate(collection, key, reverse), counter=counter)
+    if reverse:
+        decorated.reverse()
+    return [element for _, _, element in decorated]
+
+
+def _sort_decorated_in_place(sort_in_place, collection, key, reverse, counter=None):
+    decorated = _decorate(collection, key, reverse)
+    sort_in_place(decorated, counter=counter)
+    if reverse:
+        decorated.reverse()
+    for i, (_, _, element) in enumerate(decorated):
+        collection[i] = element
+
+
+def selection_sort(collection, key=None, reverse=False, counter=None):
+    if key is not None or reverse:
+        return _sort_decorated(selection_sort, collection, key, reverse, counter)
+    # Work on a copy, as elements are removed from the collection as they are selected
+    collection = collection[:]
     sorted_collection = []
     for _ in range(len(collection)):
+        if counter is not None:
+            counter.passes += 1
         current_smallest = collection[0]
         for element in collection:
             if element < current_smallest:
                 current_smallest = element
+        if counter is not None:
+            # Removing it shifts every element after it along one place, then it is appended
+            counter.moves += len(collection) - collection.index(current_smallest)
         collection.remove(current_smallest)
         sorted_collection.append(current_smallest)
     return sorted_collection
 
 
-def insertion_sort(collection):
+def selection_sort_in_place(collection, key=None, reverse=False, counter=None):
+    if key is not None or reverse:
+        return _sort_decorated_in_place(selection_sort_in_place, collection, key, reverse, counter)
+    for i in range(len(collection)):
+        if counter is not None:
+            counter.passes += 1
+        smallest = i
+        for j in range(i + 1, len(collection)):
+            if collection[j] < collection[smallest]:
+                smallest = j
+        if counter is not None and smallest != i:
+            # The smallest moves to position i and the elements from i up to it shift along one place
+            counter.moves += smallest - i + 1
+        # Move the smallest to the front of the unsorted part, shifting the others along to keep the sort stable
+        collection.insert(i, collection.pop(smallest))
+
+
+def insertion_sort(collection, key=None, reverse=False, counter=None):
+    if key is not None or reverse:
+        return _sort_decorated(insertion_sort, collection, key, reverse, counter)
+    if counter is not None:
+        counter.passes += 1
     sorted_collection = []
     for element in collection:
         i = 0
         # Scan sorted collection to find insertion spot
         while i < len(sorted_collection) and sorted_collection[i] < element:
             i += 1
+        if counter is not None:
+            # Inserting shifts every element from the insertion spot on along one place
+            counter.moves += len(sorted_collection) - i + 1
+        sorted_collection.insert(i, element)
+    return sorted_collection
+
+
+def insertion_sort_in_place(collection, key=None, reverse=False, counter=None):
+    if key is not None or reverse:
+        return _sort_decorated_in_place(insertion_sort_in_place, collection, key, reverse, counter)
+    if counter is not None:
+        counter.passes += 1
+    for i in range(1, len(collection)):
+        element = collection[i]
+        j = i
+        # Shift larger elements of the sorted front of the collection right to open the insertion spot
+        while j > 0 and element < collection[j - 1]:
+            collection[j] = collection[j - 1]
+            j -= 1
+        if counter is not None and j != i:
+            counter.moves += i - j + 1
+        collection[j] = element
+
+
+def binary_insertion_sort(collection, key=None, reverse=False, counter=None):
+    if key is not None or reverse:
+        return _sort_decorated(binary_insertion_sort, collection, key, reverse, counter)
+    if counter is not None:
+        counter.passes += 1
+    sorted_collection = []
+    for element in collection:
+        # Bisect the sorted collection for the insertion spot, after any equal elements to keep the sort stable
+        i = bisect_right(sorted_collection, element)
+        if counter is not None:
+            counter.moves += len(sorted_collection) - i + 1
         sorted_collection.insert(i, element)
     return sorted_collection
 
 
-def bubble_sort(collection):
+def adaptive_insertion_sort(collection, key=None, reverse=False, counter=None):
+    if key is not None or reverse:
+        return _sort_decorated(adaptive_insertion_sort, collection, key, reverse, counter)
+    if counter is not None:
+        counter.passes += 1
+    sorted_collection = []
+    for element in collection:
+        # Elements that belong at the end, as in sorted or append mostly input, are appended without a search
+        if not sorted_collection or not element < sorted_collection[-1]:
+            i = len(sorted_collection)
+        else:
+            i = bisect_right(sorted_collection, element)
+        if counter is not None:
+            counter.moves += len(sorted_collection) - i + 1
+        sorted_collection.insert(i, element)
+    return sorted_collection
+
+
+def bubble_sort(collection, key=None, reverse=False, counter=None):
+    if key is not None or reverse:
+        return _sort_decorated(bubble_sort, collection, key, reverse, counter)
     collection = collection[:]
     for j in range(len(collection)):
+        if counter is not None:
+            counter.passes += 1
         for i in range(len(collection) - 1 - j):
             if collection[i] > collection[i + 1]:
                 collection[i], collection[i + 1] = collection[i + 1], collection[i]
+                if counter is not None:
+                    counter.swaps += 1
+                    counter.moves += 2
     return collection
 
 
-def bubble_sort_improved(collection):
+def bubble_sort_in_place(collection, key=None, reverse=False, counter=None):
+    if key is not None or reverse:
+        return _sort_decorated_in_place(bubble_sort_in_place, collection, key, reverse, counter)
+    for j in range(len(collection)):
+        if counter is not None:
+            counter.passes += 1
+        for i in range(len(collection) - 1 - j):
+            if collection[i] > collection[i + 1]:
+                collection[i], collection[i + 1] = collection[i + 1], collection[i]
+                if counter is not None:
+                    counter.swaps += 1
+                    counter.moves += 2
+
+
+def bubble_sort_improved(collection, key=None, reverse=False, counter=None):
+    if key is not None or reverse:
+        return _sort_decorated(bubble_sort_improved, collection, key, reverse, counter)
     collection = collection[:]
     has_swapped = True
     complete_cells = 0
     while has_swapped:
+        if counter is not None:
+            counter.passes += 1
         has_swapped = False
         for i in range(len(collection) - 1 - complete_cells):
             if collection[i] > collection[i + 1]:
                 collection[i], collection[i + 1] = collection[i + 1], collection[i]
                 has_swapped = True
+                if counter is not None:
+                    counter.swaps += 1
+                    counter.moves += 2
         complete_cells += 1
     return collection
+
+
+def bubble_sort_improved_in_place(collection, key=None, reverse=False, counter=None):
+    if key is not None or reverse:
+        return _sort_decorated_in_place(bubble_sort_improved_in_place, collection, key, reverse, counter)
+    has_swapped = True
+    complete_cells = 0
+    while has_swapped:
+        if counter is not None:
+            counter.passes += 1
+        has_swapped = False
+        for i in range(len(collection) - 1 - complete_cells):
+            if collection[i] > collection[i + 1]:
+                collection[i], collection[i + 1] = collection[i + 1], collection[i]
+                has_swapped = True
+                if counter is not None:
+                    counter.swaps += 1
+                    counter.moves += 2
+        complete_cells += 1
+
+
+def _merge(left, right):
+    merged = []
+    i = 0
+    j = 0
+    while i < len(left) and j < len(right):
+        # Take from the left on ties so equal elements keep their order
+        if right[j] < left[i]:
+            merged.append(right[j])
+            j += 1
+        else:
+            merged.append(left[i])
+            i += 1
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+    return merged
+
+
+def merge_sort(collection, key=None, reverse=False, counter=None):
+    if key is not None or reverse:
+        return _sort_decorated(merge_sort, collection, key, reverse, counter)
+    if len(collection) <= 1:
+        return collection[:]
+    if counter is not None:
+        # Halving n elements down to single elements takes ceil(log2(n)) levels, each merged in one pass
+        counter.passes = max(counter.passes, (len(collection) - 1).bit_length())
+        counter.moves += len(collection)
+    middle = len(collection) // 2
+    return _merge(merge_sort(collection[:middle], counter=counter), merge_sort(collection[middle:], counter=counter))
+
+
+# Number of elements in each run that hybrid_sort sorts with binary_insertion_sort before merging
+RUN_SIZE = 32
+
+
+def hybrid_sort(collection, key=None, reverse=False, run_size=RUN_SIZE, counter=None):
+    if key is not None or reverse:
+        return _sort_decorated(
+            lambda decorated, counter: hybrid_sort(decorated, run_size=run_size, counter=counter),
+            collection,
+            key,
+            reverse,
+            counter,
+        )
+    # Insertion sort small runs, where it beats merge sort, then merge neighbouring runs until one is left. Both the
+    # runs and the merges keep equal elements in their order, so the sort is stable.
+    runs = []
+    for start in range(0, len(collection), run_size):
+        stop = start + run_size
+        runs.append(binary_insertion_sort(collection[start:stop], counter=counter))
+    if counter is not None and runs:
+        # Sorting the runs counts as a single pass over the collection, not one per run
+        counter.passes = 1
+    while len(runs) > 1:
+        if counter is not None:
+            counter.passes += 1
+        merged_runs = []
+        for i in range(0, len(runs) - 1, 2):
+            if counter is not None:
+                counter.moves += len(runs[i]) + len(runs[i + 1])
+            merged_runs.append(_merge(runs[i], runs[i + 1]))
+        if len(runs) % 2 == 1:
+            merged_runs.append(runs[-1])
+        runs = merged_runs
+    if not runs:
+        return []
+    return runs[0]
+
+
+def _integer_keys(collection, key, reverse):
+    # Compute each key once; negating the keys sorts descending while keeping equal keys in their original order
+    keys = list(collection) if key is None else [key(element) for element in collection]
+    if reverse:
+        keys = [-k for k in keys]
+    return keys
+
+
+def _counting_sort_keys(keys, collection, counter=None):
+    if counter is not None:
+        # One pass counting the keys and one placing each element
+        counter.passes += 2
+        counter.moves += len(keys)
+    smallest = min(keys)
+    counts = [0] * (max(keys) - smallest + 1)
+    for k in keys:
+        counts[k - smallest] += 1
+    # Turn the counts into the position where the first element with each key goes
+    position = 0
+    for i, count in enumerate(counts):
+        counts[i] = position
+        position += count
+    sorted_collection = [None] * len(keys)
+    for k, element in zip(keys, collection):
+        sorted_collection[counts[k - smallest]] = element
+        counts[k - smallest] += 1
+    return sorted_collection
+
+
+# Counting sort is used when the span of the integer keys is at most this many times the number of elements
+COUNTING_SORT_MAX_SPAN_FACTOR = 4
+
+
+def counting_sort(collection, key=None, reverse=False, counter=None):
+    keys = _integer_keys(collection, key, reverse)
+    if not keys:
+        return []
+    # A count per key in a span much wider than the collection, such as [0, 10**10], would not fit in memory
+    if max(keys) - min(keys) > COUNTING_SORT_MAX_SPAN_FACTOR * len(keys):
+        return _radix_sort_keys(keys, collection, counter)
+    return _counting_sort_keys(keys, collection, counter)
+
+
+# Number of bits of the key radix_sort distributes on in each pass, giving 2 ** RADIX_BITS buckets
+RADIX_BITS = 8
+
+
+def _radix_sort_keys(keys, collection, counter=None):
+    smallest = min(keys)
+    pairs = [(k - smallest, element) for k, element in zip(keys, collection)]
+    mask = (1 << RADIX_BITS) - 1
+    # Distribute on the least significant digit first; each pass is stable so earlier digits stay in order
+    for shift in range(0, (max(keys) - smallest).bit_length(), RADIX_BITS):
+        if counter is not None:
+            counter.passes += 1
+            counter.moves += len(pairs)
+        buckets = [[] for _ in range(mask + 1)]
+        for pair in pairs:
+            buckets[(pair[0] >> shift) & mask].append(pair)
+        pairs = [pair for bucket in buckets for pair in bucket]
+    return [element for _, element in pairs]
+
+
+def radix_sort(collection, key=None, reverse=False, counter=None):
+    keys = _integer_keys(collection, key, reverse)
+    if not keys:
+        return []
+    return _radix_sort_keys(keys, collection, counter)
+
+
+def auto_sort(collection, key=None, reverse=False):
+    # Pick a sort from the keys, each computed once: counting sort for integer keys in a narrow range, radix sort for
+    # other integer keys, and hybrid sort for small collections and keys that are not integers
+    keys = list(collection) if key is None else [key(element) for element in collection]
+    if len(keys) > RUN_SIZE and all(type(k) is int for k in keys):
+        if reverse:
+            keys = [-k for k in keys]
+        if max(keys) - min(keys) <= COUNTING_SORT_MAX_SPAN_FACTOR * len(keys):
+            return _counting_sort_keys(keys, collection)
+        return _radix_sort_keys(keys, collection)
+    decorated = hybrid_sort(
+        [(k, -i if reverse else i, element) for i, (k, element) in enumerate(zip(keys, collection))]
+    )
+    if reverse:
+        decorated.reverse()
+    return [element for _, _, element in decorated]
+
+
+def top_k(collection, k, key=None):
+    # A heap holding only the k largest seen so far keeps this O(n log k); the result matches the first k elements
+    # of sorting in reverse, with equal keys in their original order
+    return heapq.nlargest(k, collection, key=key)
+
+
+def bottom_k(collection, k, key=None):
+    # The k smallest, matching the first k elements of sorting, with equal keys in their original order
+    return heapq.nsmallest(k, collection, key=key)
+
+
+def nth_element(collection, n, key=None):
+    # Quickselect: partition around a random pivot and keep only the part holding position n, which takes O(n)
+    # expected time. Positions break ties between equal keys, giving the element sorting would put at index n.
+    if not 0 <= n < len(collection):
+        raise IndexError("nth_element index out of range")
+    if key is None:
+        items = [((element, i), element) for i, element in enumerate(collection)]
+    else:
+        items = [((key(element), i), element) for i, element in enumerate(collection)]
+    while True:
+        pivot = random.choice(items)[0]
+        smaller = [item for item in items if item[0] < pivot]
+        if n < len(smaller):
+            items = smaller
+        elif n == len(smaller):
+            return next(element for rank, element in items if rank == pivot)
+        else:
+            n -= len(smaller) + 1
+            items = [item for item in items if pivot < item[0]]
@@ -2,8 +2,13 @@ class Student:
     """
     Class for storing basic student information. The class serves as a mechanism for storing and returning information
     and checking equality.
+
+    The attributes are declared in __slots__ so a Student does not carry a per instance __dict__, which keeps large
+    numbers of Students small in memory.
     """
 
+    __slots__ = ("first_name", "last_name", "student_number")
+
     def __init__(self, first_name: str, last_name: str, student_number: int):
         self.first_name = first_name
         self.last_name = last_name
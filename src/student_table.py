@@ -0,0 +1,84 @@
+from array import array
+
+from src.student import Student
+
+
+class StudentTable:
+    """
+    A columnar store of student information. Rather than one object per student, the student numbers are kept in a
+    single array of 64 bit integers and all the names are kept, UTF-8 encoded, in a single byte string with an array
+    of offsets marking where each name starts and ends. Student objects are only created when a student is read from
+    the table.
+    """
+
+    def __init__(self):
+        self._student_numbers = array("q")
+        self._names = bytearray()
+        self._name_offsets = array("Q", [0])
+
+    def size(self) -> int:
+        return len(self._student_numbers)
+
+    def add(self, student: Student):
+        """
+        Add a student to the end of the table.
+
+        :raise OverflowError: If the student number does not fit in a 64 bit signed integer
+        :param student: The student to be added
+        :type student: Student
+        """
+        self._student_numbers.append(student.student_number)
+        self._names += student.first_name.encode()
+        self._name_offsets.append(len(self._names))
+        self._names += student.last_name.encode()
+        self._name_offsets.append(len(self._names))
+
+    def student_number(self, index: int) -> int:
+        """
+        Returns the student number of the student at the given index without creating a Student.
+
+        :param index: Index of the student
+        :type index: int
+        :return: The student number
+        :rtype: int
+        """
+        return self._student_numbers[index]
+
+    def get(self, index: int) -> Student:
+        """
+        Returns the student at the given index as a Student object.
+
+        :raise IndexError: If there is no student at the given index
+        :param index: Index of the student
+        :type index: int
+        :return: The student
+        :rtype: Student
+        """
+        student_number = self._student_numbers[index]
+        if index < 0:
+            index += len(self._student_numbers)
+        offsets = self._name_offsets
+        start, middle, end = offsets[2 * index], offsets[2 * index + 1], offsets[2 * index + 2]
+        first_name = self._names[start:middle].decode()
+        last_name = self._names[middle:end].decode()
+        return Student(first_name, last_name, student_number)
+
+    def index_of(self, student: Student) -> int:
+        """
+        Returns the index of the first occurrence of a given Student if it exists. If it does not exist, return a
+        sentinel value of -1.
+
+        :param student: The student to search for
+        :type student: Student
+        :return: Index of the student, or -1 if it is not found
+        :rtype: int
+        """
+        if isinstance(student, Student):
+            try:
+                return self._student_numbers.index(student.student_number)
+            except (ValueError, OverflowError, TypeError):
+                pass
+        return -1
+
+    def __repr__(self) -> str:
+        return "".join(f"{self.get(i)}\n" for i in range(self.size()))
@@ -0,0 +1,62 @@
+import io
+import unittest
+
+from src.car_rental_ledger import LedgerStats, bill_ledger, read_rental_chunks
+from src.car_rental_topic import calculate_total_charge
+
+LEDGER = (
+    b"num_days,age,rental_code,odometer_start,odometer_finish\n"
+    b"1,30,B,0,0\n"
+    b"1,20,D,0,100\n"
+    b"2,30,D,0,500\n"
+    b"2,20,B,500,1000\n"
+    b"3,45,D,10.5,1000.25\n"
+)
+
+
+class CarRentalLedgerTest(unittest.TestCase):
+    def test_read_rental_chunks_empty_ledger_yields_no_chunks(self):
+        source = io.BytesIO(b"num_days,age,rental_code,odometer_start,odometer_finish\n")
+        self.assertEqual([], list(read_rental_chunks(source, 2, LedgerStats())))
+
+    def test_read_rental_chunks_chunks_are_at_most_chunk_size(self):
+        chunks = list(read_rental_chunks(io.BytesIO(LEDGER), 2, LedgerStats()))
+        self.assertEqual([2, 2, 1], [len(chunk) for chunk in chunks])
+
+    def test_read_rental_chunks_wrong_header_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            list(read_rental_chunks(io.BytesIO(b"a,b,c\n1,2,3\n"), 2, LedgerStats()))
+
+    def test_read_rental_chunks_blank_lines_are_skipped(self):
+        source = io.BytesIO(LEDGER.replace(b"2,30,D", b"\n2,30,D") + b"\n\n")
+        chunks = list(read_rental_chunks(source, 2, LedgerStats()))
+        self.assertEqual([2, 2, 1], [len(chunk) for chunk in chunks])
+
+    def test_read_rental_chunks_row_with_missing_fields_raises_value_error_naming_line(self):
+        source = io.BytesIO(LEDGER + b"1,30,B,0\n")
+        with self.assertRaisesRegex(ValueError, "line 7"):
+            list(read_rental_chunks(source, 2, LedgerStats()))
+
+    def test_read_rental_chunks_row_with_field_not_a_number_raises_value_error_naming_line(self):
+        source = io.BytesIO(LEDGER + b"1,x,B,0,0\n")
+        with self.assertRaisesRegex(ValueError, "line 7 has age 'x'"):
+            list(read_rental_chunks(source, 2, LedgerStats()))
+
+    def test_read_rental_chunks_non_positive_chunk_size_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            list(read_rental_chunks(io.BytesIO(LEDGER), 0, LedgerStats()))
+
+    def test_bill_ledger_arbitrary_ledger_writes_correct_invoices(self):
+        invoices = io.StringIO(newline="")
+        bill_ledger(io.BytesIO(LEDGER), invoices, chunk_size=2)
+        lines = invoices.getvalue().splitlines()
+        self.assertEqual("num_days,age,rental_code,odometer_start,odometer_finish,total_charge", lines[0])
+        self.assertEqual(f"1,30,B,0,0,{calculate_total_charge(1, 30, 'B', 0, 0)}", lines[1])
+        self.assertEqual(f"3,45,D,10.5,1000.25,{calculate_total_charge(3, 45, 'D', 10.5, 1000.25)}", lines[5])
+        self.assertEqual(6, len(lines))
+
+    def test_bill_ledger_arbitrary_ledger_returns_correct_counters(self):
+        stats = bill_ledger(io.BytesIO(LEDGER), io.StringIO(newline=""), chunk_size=2)
+        self.assertEqual(5, stats.rows)
+        self.assertEqual(len(LEDGER), stats.bytes_read)
+        self.assertLessEqual(0, stats.rows_per_second())
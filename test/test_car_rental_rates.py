@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.car_rental_rates import (
+    DEFAULT_RATE_TABLE,
+    RatePricer,
+    compile_rate_table,
+    load_rate_table,
+)
+from src.car_rental_topic import calculate_total_charge
+
+RENTALS = [
+    (1, 25, "B", 0, 0),
+    (1, 24, "B", 0, 0),
+    (2, 25, "B", 500, 1000),
+    (2, 24, "B", 500, 1000),
+    (1, 25, "D", 0, 0),
+    (1, 24, "D", 0, 0),
+    (2, 25, "D", 500, 1000),
+    (2, 24, "D", 500, 1000),
+    (3, 40.5, "X", 12.5, 1000.1),
+]
+
+LUXURY_TABLE = {
+    "codes": {"L": {"daily_rate": 100, "km_rate": 1, "daily_km_allowance": 50}},
+    "default": {"daily_rate": 50, "km_rate": 0.30, "daily_km_allowance": 100},
+    "age_brackets": [
+        {"min_age": 16, "daily_surcharge": 20},
+        {"min_age": 21, "daily_surcharge": 10},
+        {"min_age": 70, "daily_surcharge": 5},
+    ],
+}
+
+
+class CarRentalRatesTest(unittest.TestCase):
+    def test_price_default_table_matches_calculate_total_charge(self):
+        pricer = RatePricer()
+        for rental in RENTALS:
+            with self.subTest(rental=rental):
+                self.assertEqual(calculate_total_charge(*rental), pricer.price(*rental))
+
+    def test_price_many_default_table_matches_calculate_total_charge(self):
+        expected = [calculate_total_charge(*rental) for rental in RENTALS]
+        self.assertEqual(expected, RatePricer().price_many(*zip(*RENTALS)))
+
+    def test_price_custom_table_uses_code_and_age_bracket(self):
+        pricer = RatePricer(LUXURY_TABLE)
+        self.assertEqual(2 * 100 + 1 * 25 + 2 * 20, pricer.price(2, 18, "L", 0, 150))
+        self.assertEqual(2 * 100 + 2 * 10, pricer.price(2, 30, "L", 0, 100))
+        self.assertEqual(2 * 50 + 2 * 5, pricer.price(2, 70, "B", 0, 0))
+
+    def test_price_age_below_first_bracket_uses_first_bracket(self):
+        self.assertEqual(50 + 20, RatePricer(LUXURY_TABLE).price(1, 10, "D", 0, 0))
+
+    def test_reload_valid_table_uses_new_rates(self):
+        pricer = RatePricer()
+        pricer.reload(LUXURY_TABLE)
+        self.assertEqual(100 + 10, pricer.price(1, 30, "L", 0, 0))
+
+    def test_reload_invalid_table_raises_value_error_and_keeps_rates(self):
+        pricer = RatePricer()
+        rates = pricer.rates()
+        with self.assertRaises(ValueError):
+            pricer.reload({"codes": {}, "default": {"daily_rate": 1}, "age_brackets": []})
+        self.assertIs(rates, pricer.rates())
+
+    def test_compile_rate_table_unordered_brackets_raises_value_error(self):
+        table = dict(
+            DEFAULT_RATE_TABLE,
+            age_brackets=[{"min_age": 25, "daily_surcharge": 0}, {"min_age": 0, "daily_surcharge": 10}],
+        )
+        with self.assertRaises(ValueError):
+            compile_rate_table(table)
+
+    def test_load_rate_table_json_file_returns_table(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rates.json")
+            with open(path, "w") as file:
+                json.dump(LUXURY_TABLE, file)
+            self.assertEqual(LUXURY_TABLE, load_rate_table(path))
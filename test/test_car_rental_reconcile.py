@@ -0,0 +1,49 @@
+import unittest
+
+from src.car_rental_reconcile import reconcile
+from src.car_rental_topic import calculate_total_charge
+
+RENTALS = [
+    (1, 30, "B", 0, 0),
+    (1, 20, "D", 0, 100),
+    (2, 30, "D", 0, 500),
+    (2, 20, "B", 500, 1000),
+    (3, 45, "D", 10.5, 1000.25),
+    (4, 24, "B", 0, 333.3),
+    (5, 70, "D", 100, 900),
+]
+
+
+class CarRentalReconcileTest(unittest.TestCase):
+    def test_reconcile_no_rentals_returns_empty_totals(self):
+        report = reconcile([], workers=1)
+        self.assertEqual(0, report.rentals)
+        self.assertEqual({}, report.totals_by_code)
+        self.assertEqual({}, report.totals_by_age_bracket)
+
+    def test_reconcile_arbitrary_rentals_returns_correct_totals(self):
+        report = reconcile(RENTALS, workers=1, shard_size=3)
+        charges = [calculate_total_charge(*rental) for rental in RENTALS]
+        self.assertEqual(7, report.rentals)
+        self.assertEqual(["B", "D"], list(report.totals_by_code))
+        self.assertAlmostEqual(charges[0] + charges[3] + charges[5], report.totals_by_code["B"])
+        self.assertAlmostEqual(charges[1] + charges[2] + charges[4] + charges[6], report.totals_by_code["D"])
+        self.assertEqual([0, 25], list(report.totals_by_age_bracket))
+        self.assertAlmostEqual(charges[1] + charges[3] + charges[5], report.totals_by_age_bracket[0])
+
+    def test_reconcile_custom_brackets_groups_by_bracket_min_age(self):
+        report = reconcile(RENTALS, workers=1, bracket_min_ages=[16, 65])
+        self.assertEqual([16, 65], list(report.totals_by_age_bracket))
+        self.assertEqual(calculate_total_charge(*RENTALS[6]), report.totals_by_age_bracket[65])
+
+    def test_reconcile_many_workers_matches_single_worker_exactly(self):
+        rentals = RENTALS * 50
+        single = reconcile(rentals, workers=1, shard_size=16)
+        many = reconcile(rentals, workers=3, shard_size=16)
+        self.assertEqual(single.totals_by_code, many.totals_by_code)
+        self.assertEqual(single.totals_by_age_bracket, many.totals_by_age_bracket)
+        self.assertLessEqual(1, len(many.worker_seconds))
+
+    def test_reconcile_non_positive_workers_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            reconcile(RENTALS, workers=0)
@@ -3,6 +3,7 @@ import unittest
 from src.car_rental_topic import (
     average_kms_per_day,
     calculate_total_charge,
+    calculate_total_charges,
     num_kms_above_average,
     total_kms,
 )
@@ -53,3 +54,25 @@ class TestFunctionsTopic(unittest.TestCase):
 
     def test_calculate_total_charge_code_D_arbitrary_under_25_returns_correct_result(self):
         self.assertEqual(165, calculate_total_charge(2, 24, "D", 500, 1000))
+
+    def test_calculate_total_charges_empty_columns_returns_empty_list(self):
+        self.assertEqual([], calculate_total_charges([], [], [], [], []))
+
+    def test_calculate_total_charges_multiple_rentals_matches_calculate_total_charge(self):
+        rentals = [
+            (1, 25, "B", 0, 0),
+            (1, 24, "B", 0, 0),
+            (2, 25, "B", 500, 1000),
+            (2, 24, "B", 500, 1000),
+            (1, 25, "D", 0, 0),
+            (1, 24, "D", 0, 0),
+            (2, 25, "D", 500, 1000),
+            (2, 24, "D", 500, 1000),
+            (3, 40, "D", 12.5, 1000.1),
+        ]
+        expected = [calculate_total_charge(*rental) for rental in rentals]
+        self.assertEqual(expected, calculate_total_charges(*zip(*rentals)))
+
+    def test_calculate_total_charges_columns_of_different_lengths_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            calculate_total_charges([1, 2], [30], ["B"], [0], [0])
@@ -1,3 +1,4 @@
+import io
 from unittest import TestCase
 
 from src.course import Course
@@ -176,3 +177,76 @@ class CourseTest(TestCase):
         course.add(Student("Niles", "MacDonald", 192837465))
         expected = "Smith, Bob\t123456789\n" "Doe, Jane\t987654321\n" "MacDonald, Niles\t192837465\n"
         self.assertEqual(expected, str(course))
+
+    def test_contains_non_student_returns_false(self):
+        course = Course("CS101")
+        course.add(Student("Bob", "Smith", 123456789))
+        self.assertFalse(course.contains(123456789))
+
+    def test_remove_duplicate_students_removes_occurrences_in_insertion_order(self):
+        course = Course("CS101")
+        course.add(Student("Jane", "First", 987654321))
+        course.add(Student("Bob", "Smith", 123456789))
+        course.add(Student("Jane", "Second", 987654321))
+        course.remove(Student("Jane", "Doe", 987654321))
+        self.assertEqual("Smith, Bob\t123456789\n" "Second, Jane\t987654321\n", str(course))
+        course.remove(Student("Jane", "Doe", 987654321))
+        self.assertFalse(course.contains(Student("Jane", "Doe", 987654321)))
+        with self.assertRaises(ValueError):
+            course.remove(Student("Jane", "Doe", 987654321))
+
+    def test_add_after_remove_returns_correct_index(self):
+        course = Course("CS101")
+        course.add(Student("Bob", "Smith", 123456789))
+        course.add(Student("Jane", "Doe", 987654321))
+        course.remove(Student("Bob", "Smith", 123456789))
+        course.add(Student("Bob", "Smith", 123456789))
+        self.assertEqual(1, course._find(Student("Bob", "Smith", 123456789)))
+        self.assertEqual(2, course.size())
+
+    def test_add_many_many_students_adds_students_in_order(self):
+        course = Course("CS101")
+        course.add(Student("Bob", "Smith", 123456789))
+        course.add_many([Student("Jane", "Doe", 987654321), Student("Niles", "MacDonald", 192837465)])
+        expected = "Smith, Bob\t123456789\n" "Doe, Jane\t987654321\n" "MacDonald, Niles\t192837465\n"
+        self.assertEqual(expected, str(course))
+        self.assertEqual(2, course._find(Student("Niles", "MacDonald", 192837465)))
+
+    def test_add_many_empty_iterable_leaves_course_unchanged(self):
+        course = Course("CS101")
+        course.add_many([])
+        self.assertEqual(0, course.size())
+
+    def test_remove_many_all_students_exist_returns_empty_list(self):
+        course = Course("CS101")
+        course.add_many([Student("Bob", "Smith", 123456789), Student("Jane", "Doe", 987654321)])
+        self.assertEqual([], course.remove_many([Student("Jane", "Doe", 987654321)]))
+        self.assertEqual("Smith, Bob\t123456789\n", str(course))
+
+    def test_remove_many_missing_students_returns_missing_students(self):
+        course = Course("CS101")
+        course.add_many([Student("Bob", "Smith", 123456789), Student("Jane", "Doe", 987654321)])
+        not_there = Student("Not", "There", 918273645)
+        jane = Student("Jane", "Doe", 987654321)
+        self.assertEqual([not_there, jane], course.remove_many([not_there, jane, jane]))
+        self.assertEqual(1, course.size())
+
+    def test_write_roster_empty_course_writes_nothing(self):
+        file = io.StringIO()
+        Course("CS101").write_roster(file)
+        self.assertEqual("", file.getvalue())
+
+    def test_write_roster_many_students_writes_same_string_as_repr(self):
+        course = Course("CS101")
+        course.add(Student("Bob", "Smith", 123456789))
+        course.add(Student("Jane", "Doe", 987654321))
+        course.add(Student("Niles", "MacDonald", 192837465))
+        file = io.StringIO()
+        course.write_roster(file)
+        self.assertEqual(str(course), file.getvalue())
+
+    def test_iter_many_students_yields_students_in_enrollment_order(self):
+        course = Course("CS101")
+        course.add(Student("Bob", "Smith", 123456789))
+        course.add(Student("Jane", "Doe", 987654321))
+        self.assertEqual([123456789, 987654321], [student.student_number for student in course])
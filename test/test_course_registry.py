@@ -0,0 +1,64 @@
+import unittest
+
+from src.course import Course
+from src.course_registry import CourseRegistry
+from src.student import Student
+
+
+class CourseRegistryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bob = Student("Bob", "Smith", 123456789)
+        self.jane = Student("Jane", "Doe", 987654321)
+        self.registry = CourseRegistry()
+        self.registry.add_course(Course("CS101"))
+        self.registry.add_course(Course("MATH101"))
+
+    def test_courses_for_empty_registry_returns_empty_list(self):
+        self.assertEqual([], CourseRegistry().courses_for(self.bob))
+
+    def test_courses_for_enrolled_student_returns_course_names_in_enrolment_order(self):
+        self.registry.add("MATH101", self.bob)
+        self.registry.add("CS101", self.bob)
+        self.registry.add("CS101", self.jane)
+        self.assertEqual(["MATH101", "CS101"], self.registry.courses_for(Student("Other", "Bob", 123456789)))
+        self.assertEqual(["CS101"], self.registry.courses_for(self.jane))
+
+    def test_add_course_with_students_indexes_existing_students(self):
+        course = Course("PHYS101")
+        course.add(self.jane)
+        self.registry.add_course(course)
+        self.assertEqual(["PHYS101"], self.registry.courses_for(self.jane))
+
+    def test_add_course_duplicate_name_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.registry.add_course(Course("CS101"))
+
+    def test_remove_student_updates_course_and_index(self):
+        self.registry.add("CS101", self.bob)
+        self.registry.add("MATH101", self.bob)
+        self.registry.remove("CS101", self.bob)
+        self.assertFalse(self.registry.get_course("CS101").contains(self.bob))
+        self.assertEqual(["MATH101"], self.registry.courses_for(self.bob))
+
+    def test_remove_student_enrolled_twice_keeps_course_until_last_removal(self):
+        self.registry.add("CS101", self.bob)
+        self.registry.add("CS101", self.bob)
+        self.registry.remove("CS101", self.bob)
+        self.assertEqual(["CS101"], self.registry.courses_for(self.bob))
+        self.registry.remove("CS101", self.bob)
+        self.assertEqual([], self.registry.courses_for(self.bob))
+
+    def test_remove_student_not_enrolled_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.registry.remove("CS101", self.bob)
+
+    def test_remove_course_drops_students_from_index(self):
+        self.registry.add("CS101", self.bob)
+        self.registry.add("MATH101", self.bob)
+        self.registry.remove_course("CS101")
+        self.assertEqual(["MATH101"], self.registry.courses_for(self.bob))
+        self.assertEqual(1, self.registry.size())
+
+    def test_add_unregistered_course_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            self.registry.add("NOPE101", self.bob)
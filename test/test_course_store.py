@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+from src.course import Course
+from src.course_store import open_course, save_course
+from src.student import Student
+
+
+class CourseStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "course.bin")
+        self.course = Course("CS101 Ünïcode")
+        self.course.add(Student("Bob", "Smith", 123456789))
+        self.course.add(Student("Zoë", "Ångström", 987654321))
+        self.course.add(Student("Niles", "MacDonald", 192837465))
+        self.course.add(Student("Jane", "Doe", 987654321))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_open_course_empty_course_returns_empty_course(self):
+        save_course(Course("Empty"), self.path)
+        with open_course(self.path) as course:
+            self.assertEqual("Empty", course.course_name)
+            self.assertEqual(0, course.size())
+            self.assertEqual("", str(course))
+
+    def test_open_course_many_students_returns_same_course(self):
+        save_course(self.course, self.path)
+        with open_course(self.path) as course:
+            self.assertEqual("CS101 Ünïcode", course.course_name)
+            self.assertEqual(4, course.size())
+            self.assertEqual(str(self.course), str(course))
+
+    def test_get_many_students_returns_correct_student(self):
+        save_course(self.course, self.path)
+        with open_course(self.path) as course:
+            self.assertEqual("Ångström, Zoë\t987654321", str(course.get(1)))
+            self.assertEqual("Doe, Jane\t987654321", str(course.get(-1)))
+            self.assertEqual(192837465, course.student_number(2))
+
+    def test_find_duplicate_students_returns_first_occurrence_index(self):
+        save_course(self.course, self.path)
+        with open_course(self.path) as course:
+            self.assertEqual(1, course._find(Student("Jane", "Doe", 987654321)))
+            self.assertEqual(-1, course._find(Student("Not", "There", 918273645)))
+
+    def test_contains_many_students_returns_correct_result(self):
+        save_course(self.course, self.path)
+        with open_course(self.path) as course:
+            self.assertTrue(course.contains(Student("Bob", "Smith", 123456789)))
+            self.assertFalse(course.contains(Student("Not", "There", 918273645)))
+            self.assertFalse(course.contains(123456789))
+
+    def test_to_course_many_students_returns_equivalent_course(self):
+        save_course(self.course, self.path)
+        with open_course(self.path) as course:
+            loaded = course.to_course()
+        self.assertEqual(self.course.course_name, loaded.course_name)
+        self.assertEqual(str(self.course), str(loaded))
+
+    def test_open_course_not_a_course_file_raises_value_error(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a course file at all, just some bytes")
+        with self.assertRaises(ValueError):
+            open_course(self.path)
+
+    def test_open_course_truncated_file_raises_value_error(self):
+        save_course(self.course, self.path)
+        with open(self.path, "rb") as file:
+            data = file.read()
+        with open(self.path, "wb") as file:
+            file.write(data[:-5])
+        with self.assertRaises(ValueError):
+            open_course(self.path)
@@ -0,0 +1,57 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from src.external_sort import external_sort
+from src.sorting_topic import merge_sort
+
+
+class ExternalSortTest(unittest.TestCase):
+    def test_external_sort_empty_iterable_returns_nothing(self):
+        self.assertEqual([], list(external_sort([])))
+
+    def test_external_sort_fits_in_one_run_returns_sorted_items(self):
+        self.assertEqual([0, 1, 2, 3], list(external_sort([3, 1, 2, 0], max_run_size=10)))
+
+    def test_external_sort_many_runs_returns_sorted_items(self):
+        rng = random.Random(1)
+        items = [rng.randint(0, 50) for _ in range(500)]
+        self.assertEqual(sorted(items), list(external_sort(iter(items), max_run_size=7)))
+
+    def test_external_sort_exact_multiple_of_run_size_returns_sorted_items(self):
+        items = [5, 3, 1, 4, 2, 0]
+        self.assertEqual([0, 1, 2, 3, 4, 5], list(external_sort(items, max_run_size=3)))
+
+    def test_external_sort_key_and_reverse_keep_equal_keys_in_order(self):
+        records = [("r%d" % i, i % 4) for i in range(40)]
+        expected = sorted(records, key=lambda record: record[1], reverse=True)
+        actual = external_sort(records, key=lambda record: record[1], reverse=True, max_run_size=6, sort=merge_sort)
+        self.assertEqual(expected, list(actual))
+
+    def test_external_sort_equal_items_keep_their_order(self):
+        # 1, 1.0 and True are all equal but can be told apart by their type
+        items = [1.0, 1, True, 0, 1, 1.0, True] * 10
+        expected = [type(item) for item in sorted(items)]
+        for max_run_size in [1000, 4]:
+            with self.subTest(max_run_size=max_run_size):
+                result = external_sort(items, max_run_size=max_run_size)
+                self.assertEqual(expected, [type(item) for item in result])
+
+    def test_external_sort_file_lines_returns_sorted_lines(self):
+        lines = io.StringIO("pear\napple\nfig\nbanana\ncherry\n")
+        self.assertEqual(
+            ["apple\n", "banana\n", "cherry\n", "fig\n", "pear\n"], list(external_sort(lines, max_run_size=2))
+        )
+
+    def test_external_sort_directory_removes_temporary_files_when_done(self):
+        with tempfile.TemporaryDirectory() as directory:
+            result = external_sort(range(100, 0, -1), max_run_size=10, directory=directory)
+            self.assertEqual(1, next(result))
+            result.close()
+            self.assertEqual([], os.listdir(directory))
+
+    def test_external_sort_non_positive_run_size_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            external_sort([1], max_run_size=0)
@@ -0,0 +1,116 @@
+import unittest
+from array import array
+
+from src.lists_accelerated import contains_fast, index_of_fast, my_sum_fast, np
+from src.lists_topic import contains_while, index_of_for, my_sum
+
+
+def outcome(search, needle, haystack):
+    """
+    Returns what a search returns, or the type of the exception it raises.
+    """
+    try:
+        return search(needle, haystack)
+    except Exception as e:
+        return type(e)
+
+
+class ListsAcceleratedTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.needles = [0, 1, 2, 3, 7, -1, 2.0, 1.5, 0.1, "a", None, float("nan"), True]
+        self.needles += [
+            2**53,
+            2**53 + 1,
+            float(2**53),
+            2**62,
+            -(2**63),
+            2**64 - 1,
+            2**70,
+            1e300,
+            float("inf"),
+        ]
+        self.haystacks = [
+            [],
+            [3, 1, 2, 1, 7],
+            (3, 1, 2, 1, 7),
+            ["a", 1, 2.0, False, float("nan")],
+            array("q", [3, 1, 2, 1, 7]),
+            array("d", [3.0, 1.0, 2.0, 1.5, float("nan")]),
+            array("f", [3.0, 0.1, 2.0, 1.5, float("nan")]),
+            array("q", [2**53 + 1, 2**62, -(2**63)]),
+            array("Q", [2**64 - 1, 0]),
+            array("d", [2.0**53, 1e300]),
+            array("u", "abca"),
+            array("d"),
+        ]
+
+    def test_contains_fast_multiple_cases_matches_contains_while(self):
+        for haystack in self.haystacks:
+            for needle in self.needles:
+                with self.subTest(haystack=haystack, needle=needle):
+                    self.assertEqual(contains_while(needle, haystack), contains_fast(needle, haystack))
+
+    def test_index_of_fast_multiple_cases_matches_index_of_for(self):
+        for haystack in self.haystacks:
+            for needle in self.needles:
+                with self.subTest(haystack=haystack, needle=needle):
+                    self.assertEqual(index_of_for(needle, haystack), index_of_fast(needle, haystack))
+
+    def test_contains_fast_and_index_of_fast_needle_not_exactly_representable_matches_loops(self):
+        cases = [
+            (float(2**53), array("q", [2**53 + 1])),
+            (2**53 + 1, array("d", [2.0**53])),
+            (0.1, array("f", [0.1])),
+        ]
+        for needle, haystack in cases:
+            with self.subTest(needle=needle, haystack=haystack):
+                self.assertFalse(contains_fast(needle, haystack))
+                self.assertEqual(-1, index_of_fast(needle, haystack))
+
+    def test_contains_fast_and_index_of_fast_iterable_without_index_falls_back_to_loop(self):
+        self.assertTrue(contains_fast(2, range(5)))
+        self.assertEqual(2, index_of_fast(2, iter(range(5))))
+        self.assertEqual(-1, index_of_fast(9, iter(range(5))))
+
+    def test_my_sum_fast_multiple_cases_matches_my_sum(self):
+        cases = [[], [1, -1], [0, 1, 2, 3, 4, 5], (0.5, 0.25), array("q", [2**62, 2**62]), array("d", [0.5, 0.25])]
+        cases.append(array("f", [0.5, 0.25]))
+        for case in cases:
+            with self.subTest(case=case):
+                self.assertEqual(my_sum(case), my_sum_fast(case))
+
+    def test_my_sum_fast_iterator_returns_sum(self):
+        self.assertEqual(15, my_sum_fast(iter(range(6))))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_contains_fast_and_index_of_fast_ndarray_matches_loops(self):
+        haystacks = [
+            np.array([3, 1, 2, 1, 7]),
+            np.array([3.0, 1.0, np.nan]),
+            np.array([3.0, 0.1, 2.0], dtype=np.float32),
+            np.array([3.0, 0.1, 2.0], dtype=np.float16),
+            np.array([2.0**53, 1e300]),
+            np.array([2**53 + 1, 2**62], dtype=np.int64),
+            np.array([2**64 - 1, 0], dtype=np.uint64),
+            np.array([True, False]),
+            np.array([], dtype=float),
+        ]
+        for haystack in haystacks:
+            for needle in self.needles:
+                with self.subTest(haystack=haystack, needle=needle):
+                    self.assertEqual(
+                        outcome(contains_while, needle, haystack), outcome(contains_fast, needle, haystack)
+                    )
+                    self.assertEqual(outcome(index_of_for, needle, haystack), outcome(index_of_fast, needle, haystack))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_my_sum_fast_ndarray_returns_sum(self):
+        self.assertEqual(15, my_sum_fast(np.arange(6)))
+        self.assertAlmostEqual(0.75, my_sum_fast(np.array([0.5, 0.25])))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_my_sum_fast_single_precision_floats_are_added_in_double_precision(self):
+        # 2**24 + 1 cannot be stored in single precision
+        values = array("f", [2.0**24, 1.0])
+        self.assertEqual(2**24 + 1, my_sum_fast(values))
+        self.assertEqual(2**24 + 1, my_sum_fast(np.array(values, dtype=np.float32)))
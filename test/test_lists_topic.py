@@ -1,6 +1,19 @@
+import math
+import random
 import unittest
 
-from src.lists_topic import contains_while, index_of_for, my_sum
+from src.lists_topic import (
+    SUM_MODES,
+    contains_many,
+    contains_sorted,
+    contains_while,
+    index_of_for,
+    index_of_many,
+    index_of_sorted,
+    lower_bound,
+    my_sum,
+    upper_bound,
+)
 
 
 class ListsTopicTest(unittest.TestCase):
@@ -37,6 +50,78 @@ class ListsTopicTest(unittest.TestCase):
     def test_index_of_for_search_for_duplicate_matching_elements_returns_index_of_first_occurrence(self):
         self.assertEqual(1, index_of_for(1, ["a", 1, 1, 2.0, False]))
 
+    def test_lower_bound_multiple_cases_matches_linear_scan(self):
+        haystack = [1, 2, 2, 2, 4, 7, 7, 9]
+        for needle in range(11):
+            with self.subTest(needle=needle):
+                expected = next((i for i, thing in enumerate(haystack) if not thing < needle), len(haystack))
+                self.assertEqual(expected, lower_bound(needle, haystack))
+
+    def test_upper_bound_multiple_cases_matches_linear_scan(self):
+        haystack = [1, 2, 2, 2, 4, 7, 7, 9]
+        for needle in range(11):
+            with self.subTest(needle=needle):
+                expected = next((i for i, thing in enumerate(haystack) if needle < thing), len(haystack))
+                self.assertEqual(expected, upper_bound(needle, haystack))
+
+    def test_contains_sorted_search_in_empty_list_returns_false(self):
+        self.assertFalse(contains_sorted("a", []))
+
+    def test_contains_sorted_search_for_no_matching_element_in_list_returns_false(self):
+        self.assertFalse(contains_sorted(4, [1, 2, 3, 5]))
+
+    def test_contains_sorted_search_for_matching_first_and_last_element_in_list_returns_true(self):
+        self.assertTrue(contains_sorted(1, [1, 2, 3, 5]))
+        self.assertTrue(contains_sorted(5, [1, 2, 3, 5]))
+
+    def test_contains_sorted_search_past_last_element_returns_false(self):
+        self.assertFalse(contains_sorted(6, [1, 2, 3, 5]))
+
+    def test_index_of_sorted_search_in_empty_list_returns_negative_1(self):
+        self.assertEqual(-1, index_of_sorted("a", []))
+
+    def test_index_of_sorted_search_for_no_matching_element_in_list_returns_negative_1(self):
+        self.assertEqual(-1, index_of_sorted(4, [1, 2, 3, 5]))
+
+    def test_index_of_sorted_search_for_duplicate_matching_elements_returns_index_of_first_occurrence(self):
+        self.assertEqual(1, index_of_sorted(2, [1, 2, 2, 2, 3]))
+
+    def test_index_of_sorted_multiple_cases_matches_index_of_for(self):
+        haystack = ["a", "b", "b", "d", "e", "e"]
+        for needle in "abcdef":
+            with self.subTest(needle=needle):
+                self.assertEqual(index_of_for(needle, haystack), index_of_sorted(needle, haystack))
+
+    def test_index_of_many_no_needles_returns_empty_list(self):
+        self.assertEqual([], index_of_many([], ["a", 1]))
+
+    def test_index_of_many_matches_index_of_for_for_every_needle(self):
+        haystack = ["a", 1, 1, 2.0, False, [1], "a"]
+        needles = ["a", 1, 2, 0, False, True, "b", [1], [2], 2.0]
+        self.assertEqual([index_of_for(needle, haystack) for needle in needles], index_of_many(needles, haystack))
+
+    def test_index_of_many_unhashable_before_equal_hashable_returns_first_occurrence(self):
+        haystack = [[1], (1,), [1]]
+        self.assertEqual([0, 1], index_of_many([[1], (1,)], haystack))
+
+    def test_index_of_many_nan_matches_index_of_for(self):
+        nan = float("nan")
+        self.assertEqual([-1], index_of_many([nan], [1, nan]))
+
+    def test_index_of_many_both_sorted_matches_index_of_for(self):
+        haystack = [1, 2, 2, 4, 7, 7, 9]
+        needles = [0, 1, 2, 3, 7, 7, 9, 10]
+        expected = [index_of_for(needle, haystack) for needle in needles]
+        self.assertEqual(expected, index_of_many(needles, haystack, both_sorted=True))
+
+    def test_contains_many_matches_contains_while_for_every_needle(self):
+        haystack = ["a", 1, 2.0, False, [1]]
+        needles = ["b", "a", False, [1], [2], 2]
+        self.assertEqual([contains_while(needle, haystack) for needle in needles], contains_many(needles, haystack))
+
+    def test_contains_many_both_sorted_returns_results_in_needle_order(self):
+        self.assertEqual([True, False, True], contains_many([1, 3, 5], [1, 2, 5], both_sorted=True))
+
     def test_my_sum_empty_list_returns_0(self):
         self.assertEqual(0, my_sum([]))
 
@@ -48,3 +133,47 @@ class ListsTopicTest(unittest.TestCase):
 
     def test_my_sum_arbitrary_list_returns_correct_sum(self):
         self.assertEqual(15, my_sum([0, 1, 2, 3, 4, 5]))
+
+    def test_my_sum_every_mode_arbitrary_list_returns_correct_sum(self):
+        for mode in SUM_MODES:
+            with self.subTest(mode=mode):
+                self.assertEqual(0, my_sum([], mode))
+                self.assertEqual(15, my_sum([0, 1, 2, 3, 4, 5], mode))
+
+    def test_my_sum_every_mode_iterator_returns_same_sum_as_list(self):
+        rng = random.Random(0)
+        values = [rng.random() for _ in range(1000)]
+        for mode in SUM_MODES:
+            with self.subTest(mode=mode):
+                self.assertEqual(my_sum(values, mode), my_sum(iter(values), mode))
+
+    def test_my_sum_accurate_modes_cancelling_values_return_exact_sum(self):
+        values = [1e100, 1.0, -1e100, 0.5] * 3
+        self.assertNotEqual(math.fsum(values), my_sum(values))
+        for mode in ["exact", "compensated"]:
+            with self.subTest(mode=mode):
+                self.assertEqual(math.fsum(values), my_sum(values, mode))
+
+    def test_my_sum_exact_large_ints_are_not_rounded(self):
+        self.assertEqual(10**20 + 1, my_sum([10**20, 1], "exact"))
+        self.assertEqual(10**20 + 1, my_sum(iter([10**20, 1]), "exact"))
+        self.assertIsInstance(my_sum([1, 2], "exact"), int)
+        self.assertEqual(1.5, my_sum([10**20, 0.5, -(10**20), 1], "exact"))
+
+    def test_my_sum_accurate_modes_many_floats_are_closer_to_exact_sum_than_naive(self):
+        rng = random.Random(1)
+        values = [rng.uniform(0, 1000) for _ in range(100000)]
+        exact = math.fsum(values)
+        naive_error = abs(my_sum(values) - exact)
+        self.assertGreater(naive_error, 0)
+        for mode in ["compensated", "pairwise"]:
+            with self.subTest(mode=mode):
+                self.assertLess(abs(my_sum(values, mode) - exact), naive_error)
+
+    def test_my_sum_compensated_infinite_values_returns_infinity(self):
+        self.assertEqual(math.inf, my_sum([1e308, 1e308], "compensated"))
+        self.assertEqual(-math.inf, my_sum([-math.inf, 1.0], "compensated"))
+
+    def test_my_sum_unknown_mode_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            my_sum([1, 2], "fast")
@@ -0,0 +1,53 @@
+import math
+import random
+import unittest
+
+from src.parallel_sort import parallel_sort
+from src.sorting_topic import merge_sort
+
+
+class ParallelSortTest(unittest.TestCase):
+    def test_parallel_sort_empty_list_returns_empty_list(self):
+        self.assertEqual([], parallel_sort([], workers=2))
+
+    def test_parallel_sort_random_floats_matches_sorted(self):
+        rng = random.Random(1)
+        values = [rng.uniform(-1000, 1000) for _ in range(5000)]
+        self.assertEqual(sorted(values), parallel_sort(values, workers=3))
+
+    def test_parallel_sort_many_duplicate_integers_matches_sorted(self):
+        rng = random.Random(2)
+        values = [rng.randint(0, 3) for _ in range(2000)]
+        self.assertEqual(sorted(values), parallel_sort(values, workers=4, typecode="q"))
+
+    def test_parallel_sort_integers_stay_integers_without_losing_precision(self):
+        values = [2**53 + 3, 2**53 + 1, 1, 2, -(2**62), 7, 5, 0]
+        result = parallel_sort(values, workers=2)
+        self.assertEqual(sorted(values), result)
+        self.assertEqual([int] * len(values), [type(value) for value in result])
+
+    def test_parallel_sort_values_not_fitting_typecode_raise_type_error(self):
+        with self.assertRaises(TypeError):
+            parallel_sort([3, 1, 2, 0], workers=2, typecode="d")
+        with self.assertRaises(TypeError):
+            parallel_sort([3.0, 1.0, 2.0, 0.0], workers=2, typecode="q")
+        with self.assertRaises(TypeError):
+            parallel_sort([3, 1.0, 2, 0], workers=2)
+
+    def test_parallel_sort_signed_zeros_keep_input_order(self):
+        values = [1.0, 0.0, -0.0, -1.0, -0.0, 0.0] * 10
+        result = parallel_sort(values, workers=2)
+        self.assertEqual(sorted(values), result)
+        self.assertEqual([math.copysign(1, v) for v in sorted(values)], [math.copysign(1, v) for v in result])
+
+    def test_parallel_sort_stable_module_sort_matches_sequential_sort(self):
+        rng = random.Random(3)
+        values = [rng.random() for _ in range(1000)]
+        self.assertEqual(merge_sort(values), parallel_sort(values, workers=2, sort=merge_sort))
+
+    def test_parallel_sort_single_worker_returns_sorted_list(self):
+        self.assertEqual([1.0, 2.0, 3.0], parallel_sort([3.0, 1.0, 2.0], workers=1))
+
+    def test_parallel_sort_non_positive_workers_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            parallel_sort([1.0], workers=0)
@@ -0,0 +1,73 @@
+import random
+import unittest
+from fractions import Fraction
+
+from src.lists_topic import my_sum
+from src.prefix_sum import FenwickTree, PrefixSums
+
+
+class PrefixSumTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.values = [5, -2, 7, 0, 3, 9, -4, 1, 8, 6, -1]
+        self.ranges = [(None, None), (0, 0), (3, 3), (2, 5), (-3, None), (None, -2), (-20, 4), (4, 20), (6, 2)]
+
+    def test_prefix_sums_range_sum_multiple_ranges_matches_my_sum_of_slice(self):
+        prefix_sums = PrefixSums(self.values)
+        for start, stop in self.ranges:
+            with self.subTest(start=start, stop=stop):
+                self.assertEqual(my_sum(self.values[start:stop]), prefix_sums.range_sum(start, stop))
+
+    def test_prefix_sums_empty_list_range_sum_returns_0(self):
+        self.assertEqual(0, PrefixSums([]).range_sum())
+        self.assertEqual(0, PrefixSums([]).size())
+
+    def test_prefix_sums_iterator_values_returns_correct_size(self):
+        self.assertEqual(11, PrefixSums(iter(self.values)).size())
+
+    def test_fenwick_tree_range_sum_multiple_ranges_matches_my_sum_of_slice(self):
+        tree = FenwickTree(self.values)
+        for start, stop in self.ranges:
+            with self.subTest(start=start, stop=stop):
+                self.assertEqual(my_sum(self.values[start:stop]), tree.range_sum(start, stop))
+
+    def test_fenwick_tree_every_prefix_matches_my_sum_of_slice(self):
+        tree = FenwickTree(self.values)
+        for stop in range(len(self.values) + 1):
+            with self.subTest(stop=stop):
+                self.assertEqual(my_sum(self.values[:stop]), tree.range_sum(0, stop))
+
+    def test_fenwick_tree_random_updates_range_sums_match_my_sum_of_slice(self):
+        rng = random.Random(0)
+        values = [rng.randrange(-50, 50) for _ in range(100)]
+        tree = FenwickTree(values)
+        for _ in range(200):
+            index = rng.randrange(-len(values), len(values))
+            if rng.random() < 0.5:
+                amount = rng.randrange(-50, 50)
+                values[index] += amount
+                tree.add(index, amount)
+            else:
+                values[index] = rng.randrange(-50, 50)
+                tree.set(index, values[index])
+            start, stop = sorted([rng.randrange(len(values) + 1), rng.randrange(len(values) + 1)])
+            self.assertEqual(my_sum(values[start:stop]), tree.range_sum(start, stop))
+        self.assertEqual(values, [tree.get(i) for i in range(tree.size())])
+
+    def test_fractions_range_sum_small_range_after_large_value_is_exact(self):
+        values = [Fraction(10**17), Fraction(1, 2), Fraction(1, 4)]
+        self.assertEqual(Fraction(3, 4), PrefixSums(values).range_sum(1, 3))
+        self.assertEqual(Fraction(3, 4), FenwickTree(values).range_sum(1, 3))
+        self.assertEqual(3 * 10**20 + 1, PrefixSums([10**20, 10**20, 10**20, 1]).range_sum())
+
+    def test_fenwick_tree_index_out_of_range_raises_index_error(self):
+        tree = FenwickTree(self.values)
+        with self.assertRaises(IndexError):
+            tree.add(11, 1)
+        with self.assertRaises(IndexError):
+            tree.set(-12, 1)
+        with self.assertRaises(IndexError):
+            tree.get(11)
+
+    def test_repr_describes_contents(self):
+        self.assertEqual("PrefixSums(size=2, total=3)", repr(PrefixSums([1, 2])))
+        self.assertEqual("FenwickTree([1, 2])", repr(FenwickTree([1, 2])))
@@ -0,0 +1,63 @@
+import unittest
+
+from src.sorted_list import SortedList
+
+
+class SortedListTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sorted_list = SortedList([5, 1, 3, 3])
+
+    def test_size_empty_list_returns_0(self):
+        self.assertEqual(0, SortedList().size())
+
+    def test_init_unsorted_elements_iterates_in_ascending_order(self):
+        self.assertEqual([1, 3, 3, 5], list(self.sorted_list))
+
+    def test_add_keeps_elements_in_ascending_order(self):
+        for element in [4, 0, 6, 3]:
+            self.sorted_list.add(element)
+        self.assertEqual([0, 1, 3, 3, 3, 4, 5, 6], list(self.sorted_list))
+        self.assertEqual(8, self.sorted_list.size())
+
+    def test_add_equal_elements_keeps_them_in_order_added(self):
+        sorted_list = SortedList([2])
+        for element in [1, 1.0, True]:
+            sorted_list.add(element)
+        self.assertEqual([int, float, bool, int], [type(element) for element in sorted_list])
+
+    def test_add_many_matches_adding_one_at_a_time(self):
+        one_at_a_time = SortedList([5, 1, 3, 3])
+        for element in [9, 2, 3]:
+            one_at_a_time.add(element)
+        self.sorted_list.add_many(iter([9, 2, 3]))
+        self.assertEqual(list(one_at_a_time), list(self.sorted_list))
+
+    def test_contains_existing_and_missing_elements(self):
+        self.assertTrue(self.sorted_list.contains(1))
+        self.assertTrue(self.sorted_list.contains(5))
+        self.assertFalse(self.sorted_list.contains(2))
+        self.assertFalse(self.sorted_list.contains(6))
+        self.assertFalse(SortedList().contains(1))
+
+    def test_index_of_duplicate_elements_returns_index_of_first_occurrence(self):
+        self.assertEqual(1, self.sorted_list.index_of(3))
+        self.assertEqual(-1, self.sorted_list.index_of(4))
+
+    def test_count_returns_number_of_equal_elements(self):
+        self.assertEqual(2, self.sorted_list.count(3))
+        self.assertEqual(0, self.sorted_list.count(4))
+
+    def test_remove_existing_element_removes_one_occurrence(self):
+        self.sorted_list.remove(3)
+        self.assertEqual([1, 3, 5], list(self.sorted_list))
+
+    def test_remove_missing_element_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.sorted_list.remove(4)
+
+    def test_get_returns_element_in_ascending_order(self):
+        self.assertEqual(1, self.sorted_list.get(0))
+        self.assertEqual(5, self.sorted_list.get(-1))
+
+    def test_repr_lists_elements_in_order(self):
+        self.assertEqual("SortedList([1, 3, 3, 5])", repr(self.sorted_list))
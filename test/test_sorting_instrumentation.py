@@ -0,0 +1,119 @@
+import unittest
+
+from src.sorting_instrumentation import instrument
+from src.sorting_topic import (
+    auto_sort,
+    bubble_sort,
+    bubble_sort_improved,
+    bubble_sort_improved_in_place,
+    bubble_sort_in_place,
+    counting_sort,
+    hybrid_sort,
+    insertion_sort,
+    insertion_sort_in_place,
+    merge_sort,
+    radix_sort,
+    selection_sort,
+    selection_sort_in_place,
+)
+
+
+class SortingInstrumentationTest(unittest.TestCase):
+    def test_instrument_returns_sorted_result_and_leaves_collection_unchanged(self):
+        collection = [3, 1, 2]
+        report = instrument(selection_sort, collection)
+        self.assertEqual([1, 2, 3], report.result)
+        self.assertEqual([3, 1, 2], collection)
+        self.assertEqual("selection_sort", report.algorithm)
+        self.assertEqual(3, report.size)
+
+    def test_instrument_bubble_sort_counts_every_adjacent_comparison(self):
+        report = instrument(bubble_sort, [4, 3, 2, 1, 0])
+        self.assertEqual(10, report.comparisons)
+        self.assertEqual(10, report.swaps)
+        self.assertEqual(5, report.passes)
+
+    def test_instrument_bubble_sort_improved_sorted_input_stops_after_one_pass(self):
+        report = instrument(bubble_sort_improved, [0, 1, 2, 3, 4])
+        self.assertEqual(1, report.passes)
+        self.assertEqual(4, report.comparisons)
+        self.assertEqual(0, report.swaps)
+
+    def test_instrument_bubble_sort_improved_one_element_out_of_place_stops_early(self):
+        report = instrument(bubble_sort_improved, [0, 1, 2, 4, 3])
+        self.assertEqual(2, report.passes)
+        self.assertEqual(1, report.swaps)
+
+    def test_instrument_insertion_sort_counts_inserted_and_shifted_elements_as_moves(self):
+        report = instrument(insertion_sort, [2, 0, 1])
+        self.assertEqual(5, report.moves)
+        self.assertEqual(1, report.passes)
+
+    def test_instrument_insertion_sort_in_place_counts_shifts_as_moves(self):
+        report = instrument(insertion_sort_in_place, [2, 0, 1])
+        self.assertEqual(4, report.moves)
+        self.assertEqual(0, report.swaps)
+
+    def test_instrument_merge_sort_counts_one_pass_per_level_of_merges(self):
+        report = instrument(merge_sort, [7, 6, 5, 4, 3, 2, 1, 0])
+        self.assertEqual(3, report.passes)
+        self.assertEqual(24, report.moves)
+
+    def test_instrument_hybrid_sort_counts_runs_as_one_pass_then_each_round_of_merges(self):
+        collection = list(range(100, 0, -1))
+        self.assertEqual(1, instrument(hybrid_sort, collection[:8]).passes)
+        self.assertEqual(3, instrument(hybrid_sort, collection).passes)
+
+    def test_instrument_integer_sorts_make_no_comparisons(self):
+        for sort, collection, passes in [(counting_sort, [3, 1, 2], 2), (radix_sort, [300, 1, 2], 2)]:
+            with self.subTest(sort=sort.__name__):
+                report = instrument(sort, collection)
+                self.assertEqual(sorted(collection), report.result)
+                self.assertEqual(0, report.comparisons)
+                self.assertEqual(passes, report.passes)
+                self.assertEqual(sorted(collection, reverse=True), instrument(sort, collection, reverse=True).result)
+
+    def test_instrument_rejects_sort_that_does_not_count_its_work(self):
+        with self.assertRaises(ValueError):
+            instrument(auto_sort, [2, 1])
+
+    def test_instrument_key_counts_comparisons_between_keys(self):
+        report = instrument(bubble_sort, ["ccc", "a", "bb"], key=len)
+        self.assertEqual(["a", "bb", "ccc"], report.result)
+        self.assertEqual(3, report.comparisons)
+
+    def test_instrument_key_or_reverse_counts_same_comparisons_as_plain_sort(self):
+        plain = instrument(bubble_sort, [4, 3, 2, 1, 0])
+        keyed = instrument(bubble_sort, [4, 3, 2, 1, 0], key=lambda x: x)
+        reversed_report = instrument(bubble_sort, [0, 1, 2, 3, 4], reverse=True)
+        self.assertEqual(10, plain.comparisons)
+        self.assertEqual(10, keyed.comparisons)
+        self.assertEqual(10, reversed_report.comparisons)
+        self.assertEqual([4, 3, 2, 1, 0], reversed_report.result)
+
+    def test_instrument_in_place_sorts_report_sorted_result(self):
+        for sort in [
+            selection_sort_in_place,
+            insertion_sort_in_place,
+            bubble_sort_in_place,
+            bubble_sort_improved_in_place,
+        ]:
+            with self.subTest(sort=sort.__name__):
+                collection = [3, 1, 2, 0]
+                report = instrument(sort, collection)
+                self.assertEqual([0, 1, 2, 3], report.result)
+                self.assertEqual([3, 1, 2, 0], collection)
+                self.assertLess(0, report.comparisons)
+                self.assertEqual([3, 2, 1, 0], instrument(sort, collection, reverse=True).result)
+
+    def test_instrument_hook_is_called_with_report(self):
+        reports = []
+        report = instrument(bubble_sort, [2, 1], hook=reports.append)
+        self.assertEqual([report], reports)
+
+    def test_as_dict_contains_counts_but_not_result(self):
+        report = instrument(bubble_sort, [2, 1])
+        self.assertEqual(
+            {"algorithm", "size", "comparisons", "swaps", "passes", "moves", "peak_bytes", "seconds"},
+            set(report.as_dict()),
+        )
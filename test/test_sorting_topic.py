@@ -1,12 +1,43 @@
 import unittest
 
 from src.sorting_topic import (
+    RUN_SIZE,
+    adaptive_insertion_sort,
+    auto_sort,
+    binary_insertion_sort,
+    bottom_k,
     bubble_sort,
     bubble_sort_improved,
+    bubble_sort_improved_in_place,
+    bubble_sort_in_place,
+    counting_sort,
+    hybrid_sort,
     insertion_sort,
+    insertion_sort_in_place,
+    merge_sort,
+    nth_element,
+    radix_sort,
     selection_sort,
+    selection_sort_in_place,
+    top_k,
 )
 
+SORTS = [
+    selection_sort,
+    insertion_sort,
+    binary_insertion_sort,
+    adaptive_insertion_sort,
+    bubble_sort,
+    bubble_sort_improved,
+    merge_sort,
+    hybrid_sort,
+    auto_sort,
+]
+
+INTEGER_SORTS = [counting_sort, radix_sort, auto_sort]
+
+IN_PLACE_SORTS = [selection_sort_in_place, insertion_sort_in_place, bubble_sort_in_place, bubble_sort_improved_in_place]
+
 
 class SortingTopicTest(unittest.TestCase):
     def setUp(self) -> None:
@@ -46,3 +77,220 @@ class SortingTopicTest(unittest.TestCase):
         for case, expect in zip(self.cases, self.expecteds):
             with self.subTest(case=case, expect=expect):
                 self.assertEqual(expect, bubble_sort_improved(case))
+
+    def test_merge_sort_multiple_cases_returns_sorted_list(self):
+        for case, expect in zip(self.cases, self.expecteds):
+            with self.subTest(case=case, expect=expect):
+                self.assertEqual(expect, merge_sort(case))
+
+    def test_hybrid_sort_multiple_cases_returns_sorted_list(self):
+        for case, expect in zip(self.cases, self.expecteds):
+            with self.subTest(case=case, expect=expect):
+                self.assertEqual(expect, hybrid_sort(case))
+
+    def test_hybrid_sort_small_run_size_multiple_cases_returns_sorted_list(self):
+        for case, expect in zip(self.cases, self.expecteds):
+            with self.subTest(case=case, expect=expect):
+                self.assertEqual(expect, hybrid_sort(case, run_size=3))
+
+    def test_hybrid_sort_equal_elements_keep_their_order(self):
+        # 1, 1.0 and True are all equal but can be told apart by their type
+        collection = [1.0, 1, True, 0, 1, 1.0, True] * 10
+        expected = [type(element) for element in sorted(collection)]
+        for run_size in [RUN_SIZE, 3]:
+            with self.subTest(run_size=run_size):
+                self.assertEqual(expected, [type(element) for element in hybrid_sort(collection, run_size=run_size)])
+
+    def test_merge_sort_does_not_modify_collection(self):
+        collection = [3, 1, 2]
+        merge_sort(collection)
+        self.assertEqual([3, 1, 2], collection)
+
+    def test_merge_sort_large_random_case_returns_sorted_list(self):
+        collection = [(i * 7919) % 1000 for i in range(1000)]
+        self.assertEqual(sorted(collection), merge_sort(collection))
+        self.assertEqual(sorted(collection), hybrid_sort(collection))
+
+    def test_all_sorts_reverse_multiple_cases_returns_reverse_sorted_list(self):
+        for sort in SORTS:
+            for case, expect in zip(self.cases, self.expecteds):
+                with self.subTest(sort=sort.__name__, case=case):
+                    self.assertEqual(expect[::-1], sort(case, reverse=True))
+
+    def test_all_sorts_key_sorts_by_key_and_keeps_equal_keys_in_order(self):
+        records = [("d", 2), ("a", 1), ("c", 2), ("b", 1), ("e", 0)]
+        for sort in SORTS:
+            with self.subTest(sort=sort.__name__):
+                result = sort(records[:], key=lambda record: record[1])
+                self.assertEqual([("e", 0), ("a", 1), ("b", 1), ("d", 2), ("c", 2)], result)
+
+    def test_all_sorts_key_and_reverse_keeps_equal_keys_in_order(self):
+        records = [("d", 2), ("a", 1), ("c", 2), ("b", 1), ("e", 0)]
+        for sort in SORTS:
+            with self.subTest(sort=sort.__name__):
+                result = sort(records[:], key=lambda record: record[1], reverse=True)
+                self.assertEqual([("d", 2), ("c", 2), ("a", 1), ("b", 1), ("e", 0)], result)
+
+    def test_all_sorts_key_is_called_once_per_element(self):
+        for sort in SORTS:
+            calls = []
+
+            def key(element):
+                calls.append(element)
+                return -element
+
+            with self.subTest(sort=sort.__name__):
+                self.assertEqual([9, 5, 3, 1], sort([3, 1, 9, 5], key=key))
+                self.assertEqual(4, len(calls))
+
+    def test_all_sorts_key_does_not_compare_elements(self):
+        class Incomparable:
+            def __init__(self, value):
+                self.value = value
+
+        elements = [Incomparable(2), Incomparable(1), Incomparable(2)]
+        for sort in SORTS:
+            with self.subTest(sort=sort.__name__):
+                result = sort(elements[:], key=lambda element: element.value)
+                self.assertEqual([elements[1], elements[0], elements[2]], result)
+
+    def test_binary_insertion_sort_multiple_cases_returns_sorted_list(self):
+        for case, expect in zip(self.cases, self.expecteds):
+            with self.subTest(case=case, expect=expect):
+                self.assertEqual(expect, binary_insertion_sort(case))
+
+    def test_adaptive_insertion_sort_multiple_cases_returns_sorted_list(self):
+        for case, expect in zip(self.cases, self.expecteds):
+            with self.subTest(case=case, expect=expect):
+                self.assertEqual(expect, adaptive_insertion_sort(case))
+
+    def test_binary_insertion_sorts_equal_elements_keep_their_order(self):
+        class Record:
+            def __init__(self, value):
+                self.value = value
+
+            def __lt__(self, other):
+                return self.value < other.value
+
+        records = [Record(2), Record(1), Record(2), Record(1)]
+        expected = [records[1], records[3], records[0], records[2]]
+        self.assertEqual(expected, binary_insertion_sort(records))
+        self.assertEqual(expected, adaptive_insertion_sort(records))
+
+    def test_selection_sort_does_not_modify_collection(self):
+        collection = [3, 1, 2]
+        selection_sort(collection)
+        self.assertEqual([3, 1, 2], collection)
+
+    def test_all_in_place_sorts_multiple_cases_sorts_collection(self):
+        for sort in IN_PLACE_SORTS:
+            for case, expect in zip(self.cases, self.expecteds):
+                with self.subTest(sort=sort.__name__, case=case):
+                    collection = case[:]
+                    self.assertIsNone(sort(collection))
+                    self.assertEqual(expect, collection)
+
+    def test_all_in_place_sorts_key_and_reverse_keep_equal_keys_in_order(self):
+        records = [("d", 2), ("a", 1), ("c", 2), ("b", 1), ("e", 0)]
+        for sort in IN_PLACE_SORTS:
+            with self.subTest(sort=sort.__name__):
+                collection = records[:]
+                sort(collection, key=lambda record: record[1], reverse=True)
+                self.assertEqual([("d", 2), ("c", 2), ("a", 1), ("b", 1), ("e", 0)], collection)
+
+    def test_all_in_place_sorts_equal_elements_keep_their_order(self):
+        class Record:
+            def __init__(self, value):
+                self.value = value
+
+            def __lt__(self, other):
+                return self.value < other.value
+
+            def __gt__(self, other):
+                return self.value > other.value
+
+        records = [Record(2), Record(1), Record(2), Record(1)]
+        for sort in IN_PLACE_SORTS:
+            with self.subTest(sort=sort.__name__):
+                collection = records[:]
+                sort(collection)
+                self.assertEqual([records[1], records[3], records[0], records[2]], collection)
+
+    def test_integer_sorts_multiple_cases_returns_sorted_list(self):
+        for sort in INTEGER_SORTS:
+            for case, expect in zip(self.cases, self.expecteds):
+                with self.subTest(sort=sort.__name__, case=case):
+                    self.assertEqual(expect, sort(case))
+
+    def test_integer_sorts_negative_integers_returns_sorted_list(self):
+        collection = [(i * 7919) % 1000 - 500 for i in range(200)]
+        for sort in INTEGER_SORTS:
+            with self.subTest(sort=sort.__name__):
+                self.assertEqual(sorted(collection), sort(collection))
+                self.assertEqual(sorted(collection, reverse=True), sort(collection, reverse=True))
+
+    def test_radix_and_auto_sort_widely_spread_integers_returns_sorted_list(self):
+        collection = [(i * 7919) % 1000 - 500 for i in range(200)] + [2**40, -(2**40), 123456789, 0]
+        for sort in [radix_sort, auto_sort]:
+            with self.subTest(sort=sort.__name__):
+                self.assertEqual(sorted(collection), sort(collection))
+                self.assertEqual(sorted(collection, reverse=True), sort(collection, reverse=True))
+
+    def test_integer_sorts_key_and_reverse_keep_equal_keys_in_order(self):
+        records = [("r%d" % i, i % 5) for i in range(100)]
+        for sort in INTEGER_SORTS:
+            with self.subTest(sort=sort.__name__):
+                self.assertEqual(sorted(records, key=lambda r: r[1]), sort(records, key=lambda r: r[1]))
+                expected = sorted(records, key=lambda r: r[1], reverse=True)
+                self.assertEqual(expected, sort(records, key=lambda r: r[1], reverse=True))
+
+    def test_counting_sort_span_much_wider_than_collection_returns_sorted_list(self):
+        self.assertEqual([0, 10**10], counting_sort([10**10, 0]))
+        self.assertEqual([10**10, 0], counting_sort([0, 10**10], reverse=True))
+
+    def test_counting_sort_non_integer_keys_raises_type_error(self):
+        with self.assertRaises(TypeError):
+            counting_sort([0.5, 1.5])
+
+    def test_auto_sort_non_integer_keys_returns_sorted_list(self):
+        collection = [(i * 7919) % 1000 / 7 for i in range(100)]
+        self.assertEqual(sorted(collection), auto_sort(collection))
+        self.assertEqual(["a", "b", "c"], auto_sort(["c", "a", "b"]))
+
+    def test_top_k_multiple_cases_returns_largest_in_descending_order(self):
+        for case, expect in zip(self.cases, self.expecteds):
+            with self.subTest(case=case):
+                self.assertEqual(expect[::-1][:3], top_k(case, 3))
+
+    def test_bottom_k_multiple_cases_returns_smallest_in_ascending_order(self):
+        for case, expect in zip(self.cases, self.expecteds):
+            with self.subTest(case=case):
+                self.assertEqual(expect[:3], bottom_k(case, 3))
+
+    def test_top_k_and_bottom_k_key_keep_equal_keys_in_order(self):
+        records = [("d", 2), ("a", 1), ("c", 2), ("b", 1), ("e", 0)]
+        self.assertEqual([("d", 2), ("c", 2), ("a", 1)], top_k(records, 3, key=lambda record: record[1]))
+        self.assertEqual([("e", 0), ("a", 1), ("b", 1)], bottom_k(records, 3, key=lambda record: record[1]))
+
+    def test_top_k_k_larger_than_collection_returns_everything_sorted(self):
+        self.assertEqual([3, 2, 1], top_k([2, 3, 1], 10))
+
+    def test_nth_element_every_index_matches_sorted(self):
+        collection = [8, 4, 3, 9, 4, 1, 5, 3, 2, 1, 5, 8, 9, 7, 6, 7, 0, 6, 0, 2]
+        expected = sorted(collection)
+        for n in range(len(collection)):
+            with self.subTest(n=n):
+                self.assertEqual(expected[n], nth_element(collection, n))
+
+    def test_nth_element_key_equal_keys_returns_element_sorting_puts_there(self):
+        records = [("d", 2), ("a", 1), ("c", 2), ("b", 1), ("e", 0)]
+        expected = sorted(records, key=lambda record: record[1])
+        for n in range(len(records)):
+            with self.subTest(n=n):
+                self.assertIs(expected[n], nth_element(records, n, key=lambda record: record[1]))
+
+    def test_nth_element_index_out_of_range_raises_index_error(self):
+        with self.assertRaises(IndexError):
+            nth_element([1, 2, 3], 3)
+        with self.assertRaises(IndexError):
+            nth_element([], 0)
@@ -32,3 +32,7 @@ class StudentTest(unittest.TestCase):
     def test_repr_arbitrary_student_returns_correct_string(self):
         student = Student("Bob", "Smith", 123456789)
         self.assertEqual("Smith, Bob\t123456789", str(student))
+
+    def test_student_has_no_instance_dict(self):
+        student = Student("Bob", "Smith", 123456789)
+        self.assertFalse(hasattr(student, "__dict__"))
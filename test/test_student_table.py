@@ -0,0 +1,46 @@
+import unittest
+
+from src.student import Student
+from src.student_table import StudentTable
+
+
+class StudentTableTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.table = StudentTable()
+        self.table.add(Student("Bob", "Smith", 123456789))
+        self.table.add(Student("Zoë", "Ångström", 987654321))
+        self.table.add(Student("", "Doe", 192837465))
+
+    def test_size_empty_table_returns_0(self):
+        self.assertEqual(0, StudentTable().size())
+
+    def test_size_many_students_returns_correct_size(self):
+        self.assertEqual(3, self.table.size())
+
+    def test_get_many_students_returns_equal_student_with_same_names(self):
+        student = self.table.get(1)
+        self.assertEqual(Student("Zoë", "Ångström", 987654321), student)
+        self.assertEqual("Ångström, Zoë\t987654321", str(student))
+
+    def test_get_negative_index_returns_student_from_end(self):
+        self.assertEqual("Doe, \t192837465", str(self.table.get(-1)))
+
+    def test_get_index_out_of_range_raises_index_error(self):
+        with self.assertRaises(IndexError):
+            self.table.get(3)
+
+    def test_student_number_many_students_returns_correct_student_number(self):
+        self.assertEqual(192837465, self.table.student_number(2))
+
+    def test_index_of_student_exists_returns_correct_index(self):
+        self.assertEqual(1, self.table.index_of(Student("Other", "Name", 987654321)))
+
+    def test_index_of_student_does_not_exist_returns_negative_1(self):
+        self.assertEqual(-1, self.table.index_of(Student("Not", "There", 918273645)))
+
+    def test_index_of_non_student_returns_negative_1(self):
+        self.assertEqual(-1, self.table.index_of(123456789))
+
+    def test_repr_many_students_returns_correct_string(self):
+        expected = "Smith, Bob\t123456789\n" "Ångström, Zoë\t987654321\n" "Doe, \t192837465\n"
+        self.assertEqual(expected, str(self.table))